@@ -134,8 +134,8 @@ def select_segments_by_definer(segment_file, segment_name=None, ifo=None):
     start, end = start + 1e-9 * start_ns, end + 1e-9 * end_ns
     did = segment_table.getColumnByName('segment_def_id')
 
-    keep = numpy.array([d in valid_id for d in did])
-    if sum(keep) > 0:
+    keep = numpy.isin(numpy.array(did), valid_id)
+    if keep.any():
         return start_end_to_segments(start[keep], end[keep])
     else:
         return segmentlist([])
@@ -1,6 +1,7 @@
 import logging
 import os
-import pathlib
+import re
+import fnmatch
 import datetime
 import numpy
 
@@ -128,10 +129,21 @@ def find_trigger_files(directory, gps_start_time, gps_end_time,
     # compare later
     num_match = maximum_string([gps_start_time, gps_end_time])
 
-    # ** means recursive, so for large directories, this is expensive.
-    # It is not too bad if date_directories is set, as we don't waste time
-    # in directories where there cant be any files.
-    glob_string = f'**/*{id_string}*{num_match}*.hdf'
+    # Walking the tree is recursive, so for large directories, this is
+    # expensive. It is not too bad if date_directories is set, as we don't
+    # waste time in directories where there cant be any files.
+    # The filename pattern is compiled once and only matched against the
+    # file names, rather than building a path object for every entry.
+    file_pattern = re.compile(
+        fnmatch.translate(f'*{id_string}*{num_match}*.hdf')
+    )
+
+    def _walk_matching(top):
+        return [os.path.join(dirpath, fname)
+                for dirpath, _, filenames in os.walk(top)
+                for fname in filenames
+                if file_pattern.match(fname)]
+
     if date_directories:
         # convert the GPS times into dates, and only use the directories
         # of those dates to search
@@ -144,13 +156,11 @@ def find_trigger_files(directory, gps_start_time, gps_end_time,
         while date_check < date_end:
             date_dir = date_check.strftime(date_directory_format)
             subdir = os.path.join(directory, date_dir)
-            matching_files_gen = pathlib.Path(subdir).glob(glob_string)
-            matching_files += [f.as_posix() for f in matching_files_gen]
+            matching_files += _walk_matching(subdir)
             date_check += one_day
     else:
         # Grab all hdf files in the directory
-        matching_files_gen = pathlib.Path(directory).glob(glob_string)
-        matching_files = [f.as_posix() for f in matching_files_gen]
+        matching_files = _walk_matching(directory)
 
     # Is the file in the time window?
     matching_files = [f for f in matching_files
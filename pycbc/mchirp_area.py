@@ -70,36 +70,18 @@ def insert_args(parser):
 
 
 def from_cli(args, parser):
-    mass_limits_sorted = sorted(args.src_class_mass_limits)
-    if args.src_class_mass_gap_max:
-        if args.src_class_mass_gap_max < mass_limits_sorted[1]:
-            parser.error('MAX_GAP value cannot be lower than MAX_NS limit')
-        return {'mass_limits':
-                 {'max_m1': mass_limits_sorted[2],
-                  'min_m2': mass_limits_sorted[0]},
-                'mass_bdary':
-                 {'ns_max': mass_limits_sorted[1],
-                  'gap_max': args.src_class_mass_gap_max},
-                'estimation_coeff':
-                 {'a0': args.src_class_eff_to_lum_distance,
-                  'b0': args.src_class_lum_distance_to_delta[0],
-                  'b1': args.src_class_lum_distance_to_delta[1],
-                  'm0': args.src_class_mchirp_to_delta},
-                'mass_gap': True,
-                'mass_gap_separate': args.src_class_mass_gap_separate,
-                'lal_cosmology': args.src_class_lal_cosmology}
-    return {'mass_limits':
-             {'max_m1': mass_limits_sorted[2],
-              'min_m2': mass_limits_sorted[0]},
-            'mass_bdary':
-             {'ns_max': mass_limits_sorted[1],
-              'gap_max': mass_limits_sorted[1]},
-            'estimation_coeff':
-             {'a0': args.src_class_eff_to_lum_distance,
-              'b0': args.src_class_lum_distance_to_delta[0],
-              'b1': args.src_class_lum_distance_to_delta[1],
-              'm0': args.src_class_mchirp_to_delta},
-            'mass_gap': False,
+    min_m2, ns_max, max_m1 = sorted(args.src_class_mass_limits)
+    gap_max = args.src_class_mass_gap_max
+    if gap_max and gap_max < ns_max:
+        parser.error('MAX_GAP value cannot be lower than MAX_NS limit')
+    b0, b1 = args.src_class_lum_distance_to_delta
+    return {'mass_limits': {'max_m1': max_m1, 'min_m2': min_m2},
+            'mass_bdary': {'ns_max': ns_max, 'gap_max': gap_max or ns_max},
+            'estimation_coeff': {'a0': args.src_class_eff_to_lum_distance,
+                                 'b0': b0,
+                                 'b1': b1,
+                                 'm0': args.src_class_mchirp_to_delta},
+            'mass_gap': bool(gap_max),
             'mass_gap_separate': args.src_class_mass_gap_separate,
             'lal_cosmology': args.src_class_lal_cosmology}
 
@@ -30,11 +30,20 @@ paper <10.1088/1361-6382/ab1101>, <10.1088/0264-9381/33/3/035010>,
 and <10.1103/PhysRevD.107.064021>.
 """
 
+import functools
 import numpy as np
 from scipy.interpolate import interp1d
 from astropy.constants import c
+from astropy.utils.data import download_file
+from pycbc.types import Array, FrequencySeries
 from pycbc.psd.read import from_numpy_arrays
 
+# The speed of light and the factors converting frequency to (angular)
+# phase, looked up once instead of reading the astropy Quantity each call
+_C = float(c.value)
+_TWO_PI_C = 2*np.pi*_C
+_TWO_PI_OVER_C = 2*np.pi/_C
+
 
 def _psd_acc_noise(f, acc_noise_level=None):
     """ The PSD of TDI-based space-borne GW
@@ -57,9 +66,24 @@ def _psd_acc_noise(f, acc_noise_level=None):
     -----
         Please see Eq.(11-13) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    s_acc = acc_noise_level**2 * (1+(4e-4/f)**2)*(1+(f/8e-3)**4)
-    s_acc_d = s_acc * (2*np.pi*f)**(-4)
-    s_acc_nu = (2*np.pi*f/c.value)**2 * s_acc_d
+    # Only integer powers appear here, so use repeated multiplication
+    # rather than the much slower generic power function. The terms are
+    # accumulated with augmented assignments, which work in place for
+    # arrays and still accept a scalar f.
+    s_acc_nu = 4e-4 / f
+    s_acc_nu *= s_acc_nu
+    s_acc_nu += 1
+    f_high = f / 8e-3
+    f_high *= f_high
+    f_high *= f_high
+    f_high += 1
+    s_acc_nu *= f_high
+    # Converting to displacement, (2*pi*f)**(-4), and then to relative
+    # frequency, (2*pi*f/c)**2, reduces to a single 1/(2*pi*f*c)**2.
+    two_pi_f_c = _TWO_PI_C*f
+    two_pi_f_c *= two_pi_f_c
+    s_acc_nu /= two_pi_f_c
+    s_acc_nu *= acc_noise_level**2
 
     return s_acc_nu
 
@@ -106,8 +130,13 @@ def psd_tianqin_acc_noise(f, acc_noise_level=1e-15):
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         and that paper for more details.
     """
-    s_acc_d = acc_noise_level**2 * (2*np.pi*f)**(-4) * (1+1e-4/f)
-    s_acc_nu = (2*np.pi*f/c.value)**2 * s_acc_d
+    # (2*pi*f)**(-4) * (2*pi*f/c)**2 reduces to 1/(2*pi*f*c)**2
+    s_acc_nu = 1e-4 / f
+    s_acc_nu += 1
+    two_pi_f_c = _TWO_PI_C*f
+    two_pi_f_c *= two_pi_f_c
+    s_acc_nu /= two_pi_f_c
+    s_acc_nu *= acc_noise_level**2
 
     return s_acc_nu
 
@@ -155,8 +184,14 @@ def _psd_oms_noise(f, oms_noise_level=None):
     -----
         Please see Eq.(9-10) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    s_oms_d = oms_noise_level**2 * (1+(2e-3/f)**4)
-    s_oms_nu = s_oms_d * (2*np.pi*f/c.value)**2
+    f_low = 2e-3 / f
+    f_low *= f_low
+    f_low *= f_low
+    f_low += 1
+    s_oms_nu = _TWO_PI_OVER_C*f
+    s_oms_nu *= s_oms_nu
+    s_oms_nu *= f_low
+    s_oms_nu *= oms_noise_level**2
 
     return s_oms_nu
 
@@ -203,8 +238,9 @@ def psd_tianqin_oms_noise(f, oms_noise_level=1e-12):
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         and that paper for more details.
     """
-    s_oms_d = oms_noise_level**2
-    s_oms_nu = s_oms_d * (2*np.pi*f/c.value)**2
+    s_oms_nu = _TWO_PI_OVER_C*f
+    s_oms_nu *= s_oms_nu
+    s_oms_nu *= oms_noise_level**2
 
     return s_oms_nu
 
@@ -249,10 +285,10 @@ def lisa_psd_components(f, acc_noise_level=3e-15, oms_noise_level=15e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    low_freq_component = psd_lisa_acc_noise(f, acc_noise_level)
-    high_freq_component = psd_lisa_oms_noise(f, oms_noise_level)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    low_freq_component = _psd_acc_noise(f, acc_noise_level)
+    high_freq_component = _psd_oms_noise(f, oms_noise_level)
 
     return low_freq_component, high_freq_component
 
@@ -274,8 +310,8 @@ def tianqin_psd_components(f, acc_noise_level=1e-15, oms_noise_level=1e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
     low_freq_component = psd_tianqin_acc_noise(f, acc_noise_level)
     high_freq_component = psd_tianqin_oms_noise(f, oms_noise_level)
 
@@ -299,10 +335,10 @@ def taiji_psd_components(f, acc_noise_level=3e-15, oms_noise_level=8e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    low_freq_component = psd_taiji_acc_noise(f, acc_noise_level)
-    high_freq_component = psd_taiji_oms_noise(f, oms_noise_level)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    low_freq_component = _psd_acc_noise(f, acc_noise_level)
+    high_freq_component = _psd_oms_noise(f, oms_noise_level)
 
     return low_freq_component, high_freq_component
 
@@ -323,13 +359,253 @@ def omega_length(f, len_arm=None):
     omega_len : float or numpy.array
         The value of 2*pi*f*arm_length.
     """
-    omega_len = 2*np.pi*f * len_arm/c.value
+    omega_len = _TWO_PI_OVER_C*len_arm * f
 
     return omega_len
 
 
+def _frequency_grid(length, delta_f, low_freq_cutoff):
+    """ The frequency grid on which the PSDs and sensitivity curves are
+    evaluated. Each public function builds it once and passes it to the
+    helpers it calls; it is not cached, so no full-length array outlives
+    the call.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+
+    Returns
+    -------
+    fr : numpy.array
+        The frequencies low_freq_cutoff + k*delta_f, k = 0, ..., length-1.
+    """
+    # The grid is kept in double precision on purpose: the noise PSDs are
+    # ~1e-40, below the normal range of single precision, and the TDI-2.0
+    # nulls need the full precision of sin/cos. Callers wanting a single
+    # precision PSD convert the final result (see `pycbc.psd.from_cli`).
+    fr = low_freq_cutoff + delta_f*np.arange(length, dtype=np.float64)
+
+    return fr
+
+
+def _phase_grid(fr, len_arm, cosine=True):
+    """ 2*pi*f*arm_length and its sine and cosine on the frequency grid.
+    These are needed both by the noise PSDs and by the GW response.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, in the unit of "Hz".
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    cosine : bool
+        Whether to evaluate the cosine. Callers which only need the
+        sine can skip it.
+
+    Returns
+    -------
+    omega_len, sin_wl, cos_wl : numpy.array
+        2*pi*f*arm_length and its sine and cosine. cos_wl is None if
+        cosine is False.
+    """
+    omega_len = omega_length(fr, len_arm)
+    cos_wl = np.cos(omega_len) if cosine else None
+
+    return omega_len, np.sin(omega_len), cos_wl
+
+
+def _noise_grid(psd_components_func, fr, len_arm, acc_noise_level,
+                oms_noise_level):
+    """ The frequency grid and the noise quantities needed by the TDI
+    channels of one detector configuration.
+
+    Parameters
+    ----------
+    psd_components_func : function
+        The function returning the PSDs of acceleration and OMS noise,
+        e.g. `lisa_psd_components`.
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+
+    Returns
+    -------
+    fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl : numpy.array
+        The frequency grid, the PSDs of acceleration and OMS noise,
+        2*pi*f*arm_length and its sine and cosine.
+    """
+    s_acc_nu, s_oms_nu = psd_components_func(fr, acc_noise_level,
+                                             oms_noise_level)
+    omega_len, sin_wl, cos_wl = _phase_grid(fr, len_arm)
+
+    return fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl
+
+
+def _grid_to_fseries(fr, data, length, delta_f, low_freq_cutoff):
+    """ Convert values sampled on the `_noise_grid` frequencies to a
+    FrequencySeries with the requested length and delta_f. The grid starts
+    at low_freq_cutoff with a spacing of delta_f, so when low_freq_cutoff is
+    a multiple of delta_f the values already lie on the output frequencies
+    and are copied across directly, rather than being re-interpolated by
+    `from_numpy_arrays`.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, in the unit of "Hz".
+    data : numpy.array
+        The PSD or CSD values at the frequencies `fr`.
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+
+    Returns
+    -------
+    fseries : FrequencySeries
+        The PSD or CSD, zero below low_freq_cutoff.
+    """
+    kmin = int(round(low_freq_cutoff / delta_f))
+    if not np.isclose(kmin*delta_f, low_freq_cutoff, rtol=1e-10, atol=0):
+        return from_numpy_arrays(fr, data, length, delta_f, low_freq_cutoff)
+    # Fill a host array first and only then wrap it, so that under a GPU
+    # scheme the result is moved to the device in a single transfer.
+    fdata = np.zeros(length)
+    fdata[kmin:] = data[:length-kmin]
+    fseries = FrequencySeries(fdata, delta_f=delta_f, copy=False)
+
+    return fseries
+
+
+def _apply_tdi2_factor(data, sin_wl, cos_wl, work):
+    """ Multiply a TDI-1.5 quantity in place by the TDI-2.0 factor,
+    4*sin(2*omega_len)**2. This is evaluated as
+    16*sin(omega_len)**2*cos(omega_len)**2, so no further trigonometric
+    function calls are needed.
+
+    Parameters
+    ----------
+    data : numpy.array
+        The TDI-1.5 PSD or CSD, modified in place.
+    sin_wl, cos_wl : numpy.array
+        The sine and cosine of 2*pi*f*arm_length.
+    work : numpy.array
+        A scratch array with the same shape as `sin_wl`,
+        it will be overwritten.
+    """
+    np.multiply(sin_wl, cos_wl, out=work)
+    work *= work
+    work *= 16
+    data *= work
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_tdi_channel(channel_func, psd_components_func, length, delta_f,
+                        low_freq_cutoff, len_arm, acc_noise_level,
+                        oms_noise_level, tdi):
+    """ The values of one TDI channel for one detector configuration. The
+    PSD depends only on these arguments and the same PSD is typically
+    requested many times (e.g. once per segment or likelihood evaluation),
+    so the result is cached. Only a few full-length channels are kept;
+    `_cached_tdi_channel.cache_clear()` releases them.
+
+    Parameters
+    ----------
+    channel_func : function
+        The function building the channel from the noise grid,
+        e.g. `_analytical_psd_tdi_XYZ`.
+    psd_components_func : function
+        The function returning the PSDs of acceleration and OMS noise,
+        e.g. `lisa_psd_components`.
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    data : numpy.array
+        The PSD or CSD values at the output frequencies. This is shared
+        between callers, so it is marked read-only.
+    """
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    noise_grid = _noise_grid(psd_components_func, fr, len_arm,
+                             acc_noise_level, oms_noise_level)
+    data = channel_func(length, delta_f, low_freq_cutoff,
+                        noise_grid, tdi).numpy()
+    # Under a GPU scheme numpy() returns a host copy, which is what is
+    # cached; `_tdi_channel` moves it back to the device as needed.
+    data.flags.writeable = False
+
+    return data
+
+
+def _tdi_channel(channel_func, psd_components_func, length, delta_f,
+                 low_freq_cutoff, len_arm, acc_noise_level, oms_noise_level,
+                 tdi, out=None):
+    """ Return a copy of the cached TDI channel, see `_cached_tdi_channel`,
+    so callers are free to modify the FrequencySeries they get back. The
+    copy is made through `pycbc.types`, so under a GPU scheme (e.g.
+    `pycbc.scheme.CUPYScheme`) it is placed on the device and later
+    filtering does not need to transfer the PSD again.
+
+    Parameters
+    ----------
+    channel_func, psd_components_func, length, delta_f, low_freq_cutoff,
+    len_arm, acc_noise_level, oms_noise_level, tdi :
+        As for `_cached_tdi_channel`.
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
+
+    Returns
+    -------
+    fseries : FrequencySeries
+        The PSD or CSD, zero below low_freq_cutoff.
+    """
+    if out is not None and (len(out) != length or out.delta_f != delta_f):
+        raise ValueError("out must have the requested length and delta_f.")
+    # The cache needs hashable keys, so 0-d arrays (or strings from
+    # configuration files) are converted here
+    delta_f = float(delta_f)
+    low_freq_cutoff = float(low_freq_cutoff)
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    data = _cached_tdi_channel(channel_func, psd_components_func, length,
+                               delta_f, low_freq_cutoff, len_arm,
+                               acc_noise_level, oms_noise_level, tdi)
+    if out is None:
+        return FrequencySeries(data, delta_f=delta_f, copy=True)
+    out[:] = Array(data, copy=False)
+
+    return out
+
+
 def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                            len_arm=None, psd_components=None, tdi=None):
+                            noise_grid=None, tdi=None):
     """ The TDI-1.5/2.0 analytical PSD (X,Y,Z channel) for TDI-based
     space-borne GW detectors.
 
@@ -341,10 +617,10 @@ def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
         Frequency step for output FrequencySeries.
     low_freq_cutoff : float
         Low-frequency cutoff for output FrequencySeries.
-    len_arm : float
-        The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
-        The PSDs of acceleration noise and OMS noise.
+    noise_grid : tuple
+        The frequency grid, the PSDs of acceleration and OMS noise,
+        2*pi*f*arm_length and its sine and cosine, as returned by
+        `_noise_grid`.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
 
@@ -356,25 +632,29 @@ def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(19-20) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = 16*(np.sin(omega_len))**2 * (s_oms_nu +
-                                       s_acc_nu*(3+np.cos(2*omega_len)))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl = noise_grid
+    # psd = 16*sin(wL)**2 * (s_oms_nu + s_acc_nu*(3+cos(2*wL))), evaluated
+    # in place, using cos(2*wL) = 1 - 2*sin(wL)**2
+    work = np.multiply(sin_wl, sin_wl)
+    psd = np.multiply(work, -2)
+    psd += 4
+    psd *= s_acc_nu
+    psd += s_oms_nu
+    psd *= work
+    psd *= 16
     if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+        _apply_tdi2_factor(psd, sin_wl, cos_wl, work)
+    fseries = _grid_to_fseries(fr, psd, length, delta_f, low_freq_cutoff)
 
     return fseries
 
 
 def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                 len_arm=2.5e9, acc_noise_level=3e-15,
-                                oms_noise_level=15e-12, tdi=None):
+                                oms_noise_level=15e-12, tdi=None,
+                                out=None):
     """ The TDI-1.5/2.0 analytical PSD (X,Y,Z channel) for LISA.
 
     Parameters
@@ -393,6 +673,9 @@ def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -402,11 +685,9 @@ def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(19-20) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_XYZ, lisa_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
@@ -414,7 +695,8 @@ def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
 def analytical_psd_tianqin_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                    len_arm=np.sqrt(3)*1e8,
                                    acc_noise_level=1e-15,
-                                   oms_noise_level=1e-12, tdi=None):
+                                   oms_noise_level=1e-12, tdi=None,
+                                   out=None):
     """ The TDI-1.5/2.0 analytical PSD (X,Y,Z channel) for TianQin.
 
     Parameters
@@ -433,6 +715,9 @@ def analytical_psd_tianqin_tdi_XYZ(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -443,18 +728,17 @@ def analytical_psd_tianqin_tdi_XYZ(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_XYZ, tianqin_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def analytical_psd_taiji_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                  len_arm=3e9, acc_noise_level=3e-15,
-                                 oms_noise_level=8e-12, tdi=None):
+                                 oms_noise_level=8e-12, tdi=None,
+                                 out=None):
     """ The TDI-1.5/2.0 analytical PSD (X,Y,Z channel) for Taiji.
 
     Parameters
@@ -473,6 +757,9 @@ def analytical_psd_taiji_tdi_XYZ(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -482,17 +769,15 @@ def analytical_psd_taiji_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_XYZ, taiji_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
-                           len_arm=None, psd_components=None, tdi=None):
+                           noise_grid=None, tdi=None):
     """ The cross-spectrum density between TDI channel X and Y.
 
     Parameters
@@ -503,10 +788,10 @@ def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
         Frequency step for output FrequencySeries.
     low_freq_cutoff : float
         Low-frequency cutoff for output FrequencySeries.
-    len_arm : float
-        The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
-        The PSDs of acceleration noise and OMS noise.
+    noise_grid : tuple
+        The frequency grid, the PSDs of acceleration and OMS noise,
+        2*pi*f*arm_length and its sine and cosine, as returned by
+        `_noise_grid`.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
 
@@ -518,25 +803,28 @@ def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(56) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    csd = (-8*np.sin(omega_len)**2 * np.cos(omega_len) *
-           (s_oms_nu+4*s_acc_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl = noise_grid
+    # csd = -8*sin(wL)**2 * cos(wL) * (s_oms_nu+4*s_acc_nu), evaluated
+    # in place
+    csd = np.multiply(s_acc_nu, 4)
+    csd += s_oms_nu
+    work = np.multiply(sin_wl, sin_wl)
+    csd *= work
+    csd *= cos_wl
+    csd *= -8
     if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        csd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, csd, length, delta_f, low_freq_cutoff)
+        _apply_tdi2_factor(csd, sin_wl, cos_wl, work)
+    fseries = _grid_to_fseries(fr, csd, length, delta_f, low_freq_cutoff)
 
     return fseries
 
 
 def analytical_csd_lisa_tdi_XY(length, delta_f, low_freq_cutoff,
                                len_arm=2.5e9, acc_noise_level=3e-15,
-                               oms_noise_level=15e-12, tdi=None):
+                               oms_noise_level=15e-12, tdi=None,
+                               out=None):
     """ The cross-spectrum density between LISA's TDI channel X and Y.
 
     Parameters
@@ -555,6 +843,9 @@ def analytical_csd_lisa_tdi_XY(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -564,17 +855,15 @@ def analytical_csd_lisa_tdi_XY(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(56) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_csd_tdi_XY, lisa_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                           len_arm=None, psd_components=None, tdi=None):
+                           noise_grid=None, tdi=None):
     """ The PSD of TDI-1.5/2.0 channel A and E.
 
     Parameters
@@ -585,10 +874,10 @@ def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
         Frequency step for output FrequencySeries.
     low_freq_cutoff : float
         Low-frequency cutoff for output FrequencySeries.
-    len_arm : float
-        The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
-        The PSDs of acceleration noise and OMS noise.
+    noise_grid : tuple
+        The frequency grid, the PSDs of acceleration and OMS noise,
+        2*pi*f*arm_length and its sine and cosine, as returned by
+        `_noise_grid`.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
 
@@ -600,26 +889,33 @@ def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(58) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = (8*(np.sin(omega_len))**2 *
-           (4*(1+np.cos(omega_len)+np.cos(omega_len)**2)*s_acc_nu +
-           (2+np.cos(omega_len))*s_oms_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl = noise_grid
+    # psd = 8*sin(wL)**2 * (4*(1+cos(wL)+cos(wL)**2)*s_acc_nu +
+    #                       (2+cos(wL))*s_oms_nu), evaluated in place
+    psd = np.multiply(cos_wl, cos_wl)
+    psd += cos_wl
+    psd += 1
+    psd *= 4
+    psd *= s_acc_nu
+    work = np.add(cos_wl, 2)
+    work *= s_oms_nu
+    psd += work
+    np.multiply(sin_wl, sin_wl, out=work)
+    psd *= work
+    psd *= 8
     if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+        _apply_tdi2_factor(psd, sin_wl, cos_wl, work)
+    fseries = _grid_to_fseries(fr, psd, length, delta_f, low_freq_cutoff)
 
     return fseries
 
 
 def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
                                len_arm=2.5e9, acc_noise_level=3e-15,
-                               oms_noise_level=15e-12, tdi=None):
+                               oms_noise_level=15e-12, tdi=None,
+                               out=None):
     """ The PSD of LISA's TDI-1.5/2.0 channel A and E.
 
     Parameters
@@ -638,6 +934,9 @@ def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -647,11 +946,9 @@ def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(58) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_AE, lisa_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
@@ -659,7 +956,8 @@ def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
 def analytical_psd_tianqin_tdi_AE(length, delta_f, low_freq_cutoff,
                                   len_arm=np.sqrt(3)*1e8,
                                   acc_noise_level=1e-15,
-                                  oms_noise_level=1e-12, tdi=None):
+                                  oms_noise_level=1e-12, tdi=None,
+                                  out=None):
     """ The PSD of TianQin's TDI-1.5/2.0 channel A and E.
 
     Parameters
@@ -678,6 +976,9 @@ def analytical_psd_tianqin_tdi_AE(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -688,18 +989,17 @@ def analytical_psd_tianqin_tdi_AE(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_AE, tianqin_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def analytical_psd_taiji_tdi_AE(length, delta_f, low_freq_cutoff,
                                 len_arm=3e9, acc_noise_level=3e-15,
-                                oms_noise_level=8e-12, tdi=None):
+                                oms_noise_level=8e-12, tdi=None,
+                                out=None):
     """ The PSD of Taiji's TDI-1.5/2.0 channel A and E.
 
     Parameters
@@ -718,6 +1018,9 @@ def analytical_psd_taiji_tdi_AE(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -727,17 +1030,15 @@ def analytical_psd_taiji_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_AE, taiji_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                          len_arm=None, psd_components=None, tdi=None):
+                          noise_grid=None, tdi=None):
     """ The PSD of TDI-1.5/2.0 channel T.
 
     Parameters
@@ -748,10 +1049,10 @@ def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
         Frequency step for output FrequencySeries.
     low_freq_cutoff : float
         Low-frequency cutoff for output FrequencySeries.
-    len_arm : float
-        The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
-        The PSDs of acceleration noise and OMS noise.
+    noise_grid : tuple
+        The frequency grid, the PSDs of acceleration and OMS noise,
+        2*pi*f*arm_length and its sine and cosine, as returned by
+        `_noise_grid`.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
 
@@ -763,25 +1064,37 @@ def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(59) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = (32*np.sin(omega_len)**2 * np.sin(omega_len/2)**2 *
-           (4*s_acc_nu*np.sin(omega_len/2)**2 + s_oms_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    fr, s_acc_nu, s_oms_nu, omega_len, sin_wl, cos_wl = noise_grid
+    # psd = 32*sin(wL)**2 * sin(wL/2)**2 *
+    #       (4*s_acc_nu*sin(wL/2)**2 + s_oms_nu), evaluated in place,
+    # using sin(wL/2)**2 = (1-cos(wL))/2 to reuse the sine and
+    # cosine. Where cos(wL) > 0 this would cancel, so the equivalent
+    # sin(wL)**2/(2*(1+cos(wL))) is used there instead.
+    sin_sq = np.multiply(sin_wl, sin_wl)
+    work = np.add(1, cos_wl)
+    work *= 2
+    sin_half_sq = np.subtract(1, cos_wl)
+    sin_half_sq *= 0.5
+    np.divide(sin_sq, work, out=sin_half_sq, where=cos_wl > 0)
+    psd = np.multiply(s_acc_nu, 4)
+    psd *= sin_half_sq
+    psd += s_oms_nu
+    psd *= sin_half_sq
+    psd *= sin_sq
+    psd *= 32
     if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+        _apply_tdi2_factor(psd, sin_wl, cos_wl, work)
+    fseries = _grid_to_fseries(fr, psd, length, delta_f, low_freq_cutoff)
 
     return fseries
 
 
 def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
                               len_arm=2.5e9, acc_noise_level=3e-15,
-                              oms_noise_level=15e-12, tdi=None):
+                              oms_noise_level=15e-12, tdi=None,
+                              out=None):
     """ The PSD of LISA's TDI-1.5/2.0 channel T.
 
     Parameters
@@ -800,6 +1113,9 @@ def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -809,11 +1125,9 @@ def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(59) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_T, lisa_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
@@ -821,7 +1135,8 @@ def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
 def analytical_psd_tianqin_tdi_T(length, delta_f, low_freq_cutoff,
                                  len_arm=np.sqrt(3)*1e8,
                                  acc_noise_level=1e-15,
-                                 oms_noise_level=1e-12, tdi=None):
+                                 oms_noise_level=1e-12, tdi=None,
+                                 out=None):
     """ The PSD of TianQin's TDI-1.5/2.0 channel T.
 
     Parameters
@@ -840,6 +1155,9 @@ def analytical_psd_tianqin_tdi_T(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -850,18 +1168,17 @@ def analytical_psd_tianqin_tdi_T(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_T, tianqin_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
 def analytical_psd_taiji_tdi_T(length, delta_f, low_freq_cutoff,
                                len_arm=3e9, acc_noise_level=3e-15,
-                               oms_noise_level=8e-12, tdi=None):
+                               oms_noise_level=8e-12, tdi=None,
+                               out=None):
     """ The PSD of Taiji's TDI-1.5/2.0 channel T.
 
     Parameters
@@ -880,6 +1197,9 @@ def analytical_psd_taiji_tdi_T(length, delta_f, low_freq_cutoff,
         The level of OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    out : FrequencySeries, optional
+        If given, the result is written into this FrequencySeries instead
+        of a new one. It must have the requested length and delta_f.
 
     Returns
     -------
@@ -889,15 +1209,72 @@ def analytical_psd_taiji_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
-    fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+    fseries = _tdi_channel(_analytical_psd_tdi_T, taiji_psd_components,
+                           length, delta_f, low_freq_cutoff, len_arm,
+                           acc_noise_level, oms_noise_level, tdi, out)
 
     return fseries
 
 
+@functools.lru_cache(maxsize=1)
+def _lisa_fplus_sq_table():
+    """ The numerical table of LISA's averaged squared antenna response,
+    used by `averaged_lisa_fplus_sq_numerical`. It is downloaded (or
+    read from the astropy cache) and padded only once per session.
+
+    Returns
+    -------
+    freqs, fp_sq : numpy.array
+        The frequencies, in the unit of "Hz", and the averaged squared
+        antenna response at those frequencies. These are shared between
+        callers, so they are marked read-only.
+    """
+    # Download the numerical LISA averaged response.
+    url = "https://zenodo.org/record/7497853/files/AvFXp2_Raw.npy"
+    file_path = download_file(url, cache=True)
+    raw = np.load(file_path)
+    # Padding the end, filled into a single preallocated table whose
+    # rows stay contiguous.
+    table = np.empty((2, raw.shape[1] + 1))
+    table[:, :-1] = raw
+    table[:, -1] = (2, 0.0012712348970728724)
+    table.flags.writeable = False
+
+    return table[0], table[1]
+
+
+def _interp_sorted(x, xp, fp):
+    """ Piecewise linear interpolation of (xp, fp) at x, with the first
+    and last segments linearly extrapolated outside the table, as
+    `interp1d(..., fill_value="extrapolate")` does.
+
+    Parameters
+    ----------
+    x : float or numpy.array
+        The points to evaluate at.
+    xp : numpy.array
+        The increasing sample points of the table.
+    fp : numpy.array
+        The table values at `xp`.
+
+    Returns
+    -------
+    y : float or numpy.array
+        The interpolated values.
+    """
+    # A single binary search locates every segment; clipping the
+    # indices makes the end segments extrapolate.
+    idx = np.searchsorted(xp, x) - 1
+    idx = np.clip(idx, 0, len(xp)-2)
+    x_low = xp[idx]
+    y_low = fp[idx]
+    y = x - x_low
+    y *= fp[idx+1] - y_low
+    y /= xp[idx+1] - x_low
+    y += y_low
+    return y
+
+
 def averaged_lisa_fplus_sq_numerical(f, len_arm=2.5e9):
     """ A numerical fit for LISA's squared antenna response function,
     averaged over sky and polarization angle.
@@ -917,20 +1294,11 @@ def averaged_lisa_fplus_sq_numerical(f, len_arm=2.5e9):
     -----
         Please see Eq.(36) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    from astropy.utils.data import download_file
-
     if len_arm != 2.5e9:
         raise ValueError("Currently only support 'len_arm=2.5e9'.")
-    # Download the numerical LISA averaged response.
-    url = "https://zenodo.org/record/7497853/files/AvFXp2_Raw.npy"
-    file_path = download_file(url, cache=True)
-    freqs, fp_sq = np.load(file_path)
-    # Padding the end.
-    freqs = np.append(freqs, 2)
-    fp_sq = np.append(fp_sq, 0.0012712348970728724)
-    fp_sq_interp = interp1d(freqs, fp_sq, kind='linear',
-                            fill_value="extrapolate")
-    fp_sq_numerical = fp_sq_interp(f)/16
+    freqs, fp_sq = _lisa_fplus_sq_table()
+    fp_sq_numerical = _interp_sorted(f, freqs, fp_sq)
+    fp_sq_numerical /= 16
 
     return fp_sq_numerical
 
@@ -959,7 +1327,12 @@ def averaged_fplus_sq_approximated(f, len_arm=None):
     -----
         Please see Eq.(9) in <10.1088/1361-6382/ab1101> for more details.
     """
-    fp_sq_approx = (3./20.)*(1./(1.+0.6*omega_length(f, len_arm)**2))
+    # Evaluated in place, with a single division
+    fp_sq_approx = omega_length(f, len_arm)
+    fp_sq_approx *= fp_sq_approx
+    fp_sq_approx *= 0.6
+    fp_sq_approx += 1.
+    fp_sq_approx = (3./20.) / fp_sq_approx
 
     return fp_sq_approx
 
@@ -1004,6 +1377,47 @@ def averaged_tianqin_fplus_sq_numerical(f, len_arm=np.sqrt(3)*1e8):
     return fp_sq_numerical
 
 
+def _averaged_response_tdi(omega_len, ave_fp2, tdi, sin_wl=None,
+                           cos_wl=None):
+    """ The TDI-1.5/2.0 response function to GW, averaged over sky and
+    polarization angle, (4*omega_len)**2 * sin(omega_len)**2 * ave_fp2,
+    with the TDI-2.0 factor 4*sin(2*omega_len)**2, evaluated as
+    16*sin(omega_len)**2*cos(omega_len)**2, applied if needed.
+    The product is accumulated in place to avoid full-length temporaries.
+
+    Parameters
+    ----------
+    omega_len : float or numpy.array
+        The value of 2*pi*f*arm_length.
+    ave_fp2 : float or numpy.array
+        The sky and polarization angle averaged squared antenna response.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+    sin_wl, cos_wl : float or numpy.array, optional
+        The sine and cosine of omega_len, if already known.
+
+    Returns
+    -------
+    response_tdi : float or numpy.array
+        The sky and polarization angle averaged TDI-1.5/2.0 response to GW.
+    """
+    if sin_wl is None:
+        sin_wl = np.sin(omega_len)
+    response_tdi = omega_len * omega_len
+    response_tdi *= 16
+    response_tdi *= ave_fp2
+    response_tdi *= sin_wl * sin_wl
+    if str(tdi) == "2.0":
+        if cos_wl is None:
+            cos_wl = np.cos(omega_len)
+        work = sin_wl * cos_wl
+        work *= work
+        work *= 16
+        response_tdi *= work
+
+    return response_tdi
+
+
 def averaged_response_lisa_tdi(f, len_arm=2.5e9, tdi=None):
     """ LISA's TDI-1.5/2.0 response function to GW,
     averaged over sky and polarization angle.
@@ -1025,14 +1439,11 @@ def averaged_response_lisa_tdi(f, len_arm=2.5e9, tdi=None):
     -----
         Please see Eq.(39-40) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    omega_len = omega_length(f, len_arm)
-    ave_fp2 = averaged_lisa_fplus_sq_numerical(f, len_arm)
-    response_tdi = (4*omega_len)**2 * np.sin(omega_len)**2 * ave_fp2
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        response_tdi *= tdi2_factor
+    omega_len = omega_length(f, len_arm)
+    ave_fp2 = averaged_lisa_fplus_sq_numerical(f, len_arm)
+    response_tdi = _averaged_response_tdi(omega_len, ave_fp2, tdi)
 
     return response_tdi
 
@@ -1055,14 +1466,11 @@ def averaged_response_tianqin_tdi(f, len_arm=np.sqrt(3)*1e8, tdi=None):
     response_tdi : float or numpy.array
         The sky and polarization angle averaged TDI-1.5/2.0 response to GW.
     """
-    omega_len = omega_length(f, len_arm)
-    ave_fp2 = averaged_tianqin_fplus_sq_numerical(f, len_arm)
-    response_tdi = (4*omega_len)**2 * np.sin(omega_len)**2 * ave_fp2
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        response_tdi *= tdi2_factor
+    omega_len = omega_length(f, len_arm)
+    ave_fp2 = averaged_tianqin_fplus_sq_numerical(f, len_arm)
+    response_tdi = _averaged_response_tdi(omega_len, ave_fp2, tdi)
 
     return response_tdi
 
@@ -1085,18 +1493,107 @@ def averaged_response_taiji_tdi(f, len_arm=3e9, tdi=None):
     response_tdi : float or numpy.array
         The sky and polarization angle averaged TDI-1.5/2.0 response to GW.
     """
-    omega_len = omega_length(f, len_arm)
-    ave_fp2 = averaged_fplus_sq_approximated(f, len_arm)
-    response_tdi = (4*omega_len)**2 * np.sin(omega_len)**2 * ave_fp2
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        response_tdi *= tdi2_factor
+    omega_len = omega_length(f, len_arm)
+    ave_fp2 = averaged_fplus_sq_approximated(f, len_arm)
+    response_tdi = _averaged_response_tdi(omega_len, ave_fp2, tdi)
 
     return response_tdi
 
 
+def _response_grid(fplus_sq_func, fr, len_arm, cosine=True):
+    """ 2*pi*f*arm_length, with its sine and cosine, and the averaged
+    squared antenna response on the frequency grid. Both the sensitivity
+    curves and the TDI responses of the confusion noise PSDs need these.
+
+    Parameters
+    ----------
+    fplus_sq_func : function
+        The function returning the averaged square of the antenna
+        response, e.g. `averaged_lisa_fplus_sq_numerical`.
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    cosine : bool
+        Whether to evaluate the cosine of 2*pi*f*arm_length, see
+        `_phase_grid`.
+
+    Returns
+    -------
+    omega_len, sin_wl, cos_wl, fp_sq : numpy.array
+        2*pi*f*arm_length, its sine and cosine (None if cosine is False),
+        and the sky and polarization angle averaged squared antenna
+        response.
+    """
+    omega_len, sin_wl, cos_wl = _phase_grid(fr, len_arm, cosine)
+    fp_sq = fplus_sq_func(fr, len_arm)
+
+    return omega_len, sin_wl, cos_wl, fp_sq
+
+
+def _sensitivity_curve_analytical_array(fr, len_arm, acc_noise_level,
+                                        oms_noise_level, psd_components_func,
+                                        fplus_sq_func, response_grid=None):
+    """ The (semi-)analytical sensitivity curve (6-links) of TDI-based
+    space-borne GW detectors, averaged over sky and polarization angle.
+    The detectors only differ in their noise model and their averaged
+    response. The noise PSDs are evaluated on the given grid; the phase
+    grid and the averaged response are taken from `response_grid`, so a
+    caller which also needs them builds them only once.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    psd_components_func : function
+        The function returning the PSDs of acceleration and OMS noise,
+        e.g. `lisa_psd_components`.
+    fplus_sq_func : function
+        The function returning the averaged square of the antenna
+        response, e.g. `averaged_lisa_fplus_sq_numerical`.
+    response_grid : tuple, optional
+        omega_len, sin_wl, cos_wl and fp_sq on the grid, as returned by
+        `_response_grid`, if the caller already has them.
+
+    Returns
+    -------
+    sense_curve : numpy.array
+        The sky and polarization angle averaged sensitivity curve,
+        on the frequency grid of `_frequency_grid`.
+    """
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    if response_grid is None:
+        response_grid = _response_grid(fplus_sq_func, fr, len_arm,
+                                       cosine=False)
+    omega_len, sin_wl, _, fp_sq = response_grid
+    s_acc_nu, s_oms_nu = psd_components_func(fr, acc_noise_level,
+                                             oms_noise_level)
+    # sense_curve = (s_oms_nu + s_acc_nu*(3+cos(2*wL))) / (2*wL**2*fp_sq),
+    # evaluated in place, using cos(2*wL) = 1 - 2*sin(wL)**2 with the
+    # sine of the response grid
+    sense_curve = np.multiply(sin_wl, sin_wl)
+    sense_curve *= -2
+    sense_curve += 4
+    sense_curve *= s_acc_nu
+    sense_curve += s_oms_nu
+    work = np.multiply(omega_len, omega_len)
+    work *= fp_sq
+    work *= 2
+    sense_curve /= work
+
+    return sense_curve
+
+
 def sensitivity_curve_lisa_semi_analytical(length, delta_f, low_freq_cutoff,
                                            len_arm=2.5e9,
                                            acc_noise_level=3e-15,
@@ -1128,17 +1625,11 @@ def sensitivity_curve_lisa_semi_analytical(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(42-43) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    fp_sq = averaged_lisa_fplus_sq_numerical(fr, len_arm)
-    s_acc_nu, s_oms_nu = lisa_psd_components(
-                            fr, acc_noise_level, oms_noise_level)
-    omega_len = omega_length(fr, len_arm)
-    sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
-                   (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_analytical_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, lisa_psd_components,
+        averaged_lisa_fplus_sq_numerical)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
@@ -1172,17 +1663,11 @@ def sensitivity_curve_tianqin_analytical(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged analytical
         TianQin's sensitivity curve (6-links).
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    fp_sq = averaged_tianqin_fplus_sq_numerical(fr, len_arm)
-    s_acc_nu, s_oms_nu = tianqin_psd_components(
-                            fr, acc_noise_level, oms_noise_level)
-    omega_len = omega_length(fr, len_arm)
-    sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
-                   (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_analytical_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, tianqin_psd_components,
+        averaged_tianqin_fplus_sq_numerical)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
@@ -1215,22 +1700,51 @@ def sensitivity_curve_taiji_analytical(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged analytical
         Taiji's sensitivity curve (6-links).
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    fp_sq = averaged_fplus_sq_approximated(fr, len_arm)
-    s_acc_nu, s_oms_nu = taiji_psd_components(
-                            fr, acc_noise_level, oms_noise_level)
-    omega_len = omega_length(fr, len_arm)
-    sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
-                   (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_analytical_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, taiji_psd_components,
+        averaged_fplus_sq_approximated)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
 
 
+def _sensitivity_curve_lisa_SciRD_array(fr):
+    """ The LISA SciRD sensitivity curve, see
+    `sensitivity_curve_lisa_SciRD`.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+
+    Returns
+    -------
+    sense_curve : numpy.array
+        The curve on the frequency grid of `_frequency_grid`.
+    """
+    # sense_curve = 10/3 * (s_I/(2*pi*f)**4 + s_II) * R, with
+    # s_I = 5.76e-48*(1+(4e-4/f)**2), s_II = 3.6e-41 and
+    # R = 1+(f/2.5e-2)**2, evaluated in place
+    sense_curve = 4e-4 / fr
+    sense_curve *= sense_curve
+    sense_curve += 1
+    sense_curve *= 5.76e-48
+    work = 2*np.pi*fr
+    work *= work
+    work *= work
+    sense_curve /= work
+    sense_curve += 3.6e-41
+    np.divide(fr, 2.5e-2, out=work)
+    work *= work
+    work += 1
+    sense_curve *= work
+    sense_curve *= 10/3
+
+    return sense_curve
+
+
 def sensitivity_curve_lisa_SciRD(length, delta_f, low_freq_cutoff):
     """ The analytical LISA's sensitivity curve in SciRD,
     averaged over sky and polarization angle.
@@ -1253,17 +1767,53 @@ def sensitivity_curve_lisa_SciRD(length, delta_f, low_freq_cutoff):
     -----
         Please see Eq.(114) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_I = 5.76e-48 * (1+(4e-4/fr)**2)
-    s_II = 3.6e-41
-    R = 1 + (fr/2.5e-2)**2
-    sense_curve = 10/3 * (s_I/(2*np.pi*fr)**4+s_II) * R
-    fseries = from_numpy_arrays(fr, sense_curve, length,
-                                delta_f, low_freq_cutoff)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_lisa_SciRD_array(fr)
+    fseries = from_numpy_arrays(fr, sense_curve, length, delta_f,
+                                low_freq_cutoff)
 
     return fseries
 
 
+def _confusion_fit_lisa_array(fr, duration):
+    """ The LISA Galactic confusion noise fit, see `confusion_fit_lisa`.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    duration : float
+        The duration of observation, in the unit of years.
+
+    Returns
+    -------
+    sh_confusion : numpy.array
+        The curve on the frequency grid of `_frequency_grid`.
+    """
+    f1 = 10**(-0.25*np.log10(duration)-2.7)
+    fk = 10**(-0.27*np.log10(duration)-2.47)
+    # sh_confusion = 0.5*1.14e-44 * fr**(-7/3) * exp(-(fr/f1)**1.8) *
+    #                (1+tanh((fk-fr)/0.31e-3)), evaluated in place. Both
+    # non-integer powers come from a single log(fr), and the first two
+    # factors are merged into exp(-7/3*log(fr) - (fr/f1)**1.8).
+    log_fr = np.log(fr)
+    sh_confusion = np.subtract(log_fr, np.log(f1))
+    sh_confusion *= 1.8
+    np.exp(sh_confusion, out=sh_confusion)
+    log_fr *= 7/3
+    sh_confusion += log_fr
+    np.negative(sh_confusion, out=sh_confusion)
+    np.exp(sh_confusion, out=sh_confusion)
+    work = np.subtract(fk, fr)
+    work /= 0.31e-3
+    np.tanh(work, out=work)
+    work += 1
+    sh_confusion *= work
+    sh_confusion *= 0.5*1.14e-44
+
+    return sh_confusion
+
+
 def confusion_fit_lisa(length, delta_f, low_freq_cutoff, duration=1.0):
     """ The LISA's sensitivity curve for Galactic confusion noise,
     averaged over sky and polarization angle. No instrumental noise.
@@ -1289,17 +1839,82 @@ def confusion_fit_lisa(length, delta_f, low_freq_cutoff, duration=1.0):
     -----
         Please see Eq.(85-86) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    f1 = 10**(-0.25*np.log10(duration)-2.7)
-    fk = 10**(-0.27*np.log10(duration)-2.47)
-    sh_confusion = (0.5*1.14e-44*fr**(-7/3)*np.exp(-(fr/f1)**1.8) *
-                    (1.0+np.tanh((fk-fr)/0.31e-3)))
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sh_confusion = _confusion_fit_lisa_array(fr, duration)
     fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
 
 
+# The coefficients of the TianQin confusion noise fit, a0 to a6, for the
+# observation times in _TIANQIN_CONFUSION_T_OBS, see
+# `confusion_fit_tianqin`.
+_TIANQIN_CONFUSION_T_OBS = (0.5, 1, 2, 4, 5)
+_TIANQIN_CONFUSION_COEFFS = (
+    (-18.6, -18.6, -18.6, -18.6, -18.6),
+    (-1.22, -1.13, -1.45, -1.43, -1.51),
+    (0.009, -0.945, 0.315, -0.687, -0.710),
+    (-1.87, -1.02, -1.19, 0.24, -1.13),
+    (0.65, 4.05, -4.48, -0.15, -0.83),
+    (3.6, -4.5, 10.8, -1.8, 13.2),
+    (-4.6, -0.5, -9.4, -3.2, -19.1),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _tianqin_confusion_fits():
+    """ The cubic interpolants of the TianQin confusion noise fit
+    coefficients over the observation time. These do not depend on the
+    arguments of `confusion_fit_tianqin`, so they are only built once.
+
+    Returns
+    -------
+    fits : list of scipy.interpolate.interp1d
+        The interpolants of the coefficients a0 to a6.
+    """
+    return [interp1d(_TIANQIN_CONFUSION_T_OBS, a_i, kind='cubic',
+                     fill_value="extrapolate")
+            for a_i in _TIANQIN_CONFUSION_COEFFS]
+
+
+def _confusion_fit_tianqin_array(fr, duration):
+    """ The TianQin Galactic confusion noise fit, see
+    `confusion_fit_tianqin`.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    duration : float
+        The duration of observation, in the unit of years.
+
+    Returns
+    -------
+    sh_confusion : numpy.array
+        The curve on the frequency grid of `_frequency_grid`.
+    """
+    if duration not in _TIANQIN_CONFUSION_T_OBS:
+        raise Warning("Note that the results between " +
+                      "0.5, 1, 2, 4, and 5 years are extrapolated, " +
+                      "might be non-physical.")
+    # 10/3 is the factor for sky-average, the original fit in the paper
+    # is not sky-averaged. The polynomial in log10(f/mHz) is evaluated by
+    # Horner's rule, and (10**poly)**2 as exp(2*ln(10)*poly).
+    coeffs = [fit(duration) for fit in _tianqin_confusion_fits()]
+    log10_f = np.log10(fr*1e3)
+    sh_confusion = np.polynomial.polynomial.polyval(log10_f, coeffs)
+    sh_confusion *= 2*np.log(10)
+    np.exp(sh_confusion, out=sh_confusion)
+    sh_confusion *= 10./3
+    # avoid the jump of values
+    sh_confusion[(fr > 3e-4) & (fr < 5e-4)] = \
+        sh_confusion[(np.abs(fr - 5e-4)).argmin()]
+    sh_confusion[(fr < 3e-4) | (fr > 1e-2)] = 0
+
+    return sh_confusion
+
+
 def confusion_fit_tianqin(length, delta_f, low_freq_cutoff, duration=1.0):
     """ The TianQin's sensitivity curve for Galactic confusion noise,
     averaged over sky and polarization angle. No instrumental noise.
@@ -1328,48 +1943,77 @@ def confusion_fit_tianqin(length, delta_f, low_freq_cutoff, duration=1.0):
         Please see Table(II) in <10.1103/PhysRevD.102.063021>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    t_obs = [0.5, 1, 2, 4, 5]
-    a0 = [-18.6, -18.6, -18.6, -18.6, -18.6]
-    a1 = [-1.22, -1.13, -1.45, -1.43, -1.51]
-    a2 = [0.009, -0.945, 0.315, -0.687, -0.710]
-    a3 = [-1.87, -1.02, -1.19, 0.24, -1.13]
-    a4 = [0.65, 4.05, -4.48, -0.15, -0.83]
-    a5 = [3.6, -4.5, 10.8, -1.8, 13.2]
-    a6 = [-4.6, -0.5, -9.4, -3.2, -19.1]
-    fit_a0 = interp1d(t_obs, a0, kind='cubic', fill_value="extrapolate")
-    fit_a1 = interp1d(t_obs, a1, kind='cubic', fill_value="extrapolate")
-    fit_a2 = interp1d(t_obs, a2, kind='cubic', fill_value="extrapolate")
-    fit_a3 = interp1d(t_obs, a3, kind='cubic', fill_value="extrapolate")
-    fit_a4 = interp1d(t_obs, a4, kind='cubic', fill_value="extrapolate")
-    fit_a5 = interp1d(t_obs, a5, kind='cubic', fill_value="extrapolate")
-    fit_a6 = interp1d(t_obs, a6, kind='cubic', fill_value="extrapolate")
-    if duration not in t_obs:
-        raise Warning("Note that the results between " +
-                      "0.5, 1, 2, 4, and 5 years are extrapolated, " +
-                      "might be non-physical.")
-    # 10/3 is the factor for sky-average, the original fit in the paper
-    # is not sky-averaged.
-    sh_confusion = 10./3 * np.power(
-        10,
-        fit_a0(duration) +
-        fit_a1(duration) * np.log10(fr*1e3) +
-        fit_a2(duration) * np.log10(fr*1e3)**2 +
-        fit_a3(duration) * np.log10(fr*1e3)**3 +
-        fit_a4(duration) * np.log10(fr*1e3)**4 +
-        fit_a5(duration) * np.log10(fr*1e3)**5 +
-        fit_a6(duration) * np.log10(fr*1e3)**6
-    )**2
-    # avoid the jump of values
-    sh_confusion[(fr > 3e-4) & (fr < 5e-4)] = \
-        sh_confusion[(np.abs(fr - 5e-4)).argmin()]
-    sh_confusion[(fr < 3e-4) | (fr > 1e-2)] = 0
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sh_confusion = _confusion_fit_tianqin_array(fr, duration)
     fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
 
 
+# The coefficients of the Taiji confusion noise fit, a0 to a5, for the
+# observation times in _TAIJI_CONFUSION_T_OBS, see `confusion_fit_taiji`.
+_TAIJI_CONFUSION_T_OBS = (0.5, 1, 2, 4)
+_TAIJI_CONFUSION_COEFFS = (
+    (-85.3498, -85.4336, -85.3919, -85.5448),
+    (-2.64899, -2.46276, -2.69735, -3.23671),
+    (-0.0699707, -0.183175, -0.749294, -1.64187),
+    (-0.478447, -0.884147, -1.15302, -1.14711),
+    (-0.334821, -0.427176, -0.302761, 0.0325887),
+    (0.0658353, 0.128666, 0.175521, 0.187854),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _taiji_confusion_fits():
+    """ The cubic interpolants of the Taiji confusion noise fit
+    coefficients over the observation time. These do not depend on the
+    arguments of `confusion_fit_taiji`, so they are only built once.
+
+    Returns
+    -------
+    fits : list of scipy.interpolate.interp1d
+        The interpolants of the coefficients a0 to a5.
+    """
+    return [interp1d(_TAIJI_CONFUSION_T_OBS, a_i, kind='cubic',
+                     fill_value="extrapolate")
+            for a_i in _TAIJI_CONFUSION_COEFFS]
+
+
+def _confusion_fit_taiji_array(fr, duration):
+    """ The Taiji Galactic confusion noise fit, see `confusion_fit_taiji`.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    duration : float
+        The duration of observation, in the unit of years.
+
+    Returns
+    -------
+    sh_confusion : numpy.array
+        The curve on the frequency grid of `_frequency_grid`.
+    """
+    if duration not in _TAIJI_CONFUSION_T_OBS:
+        raise Warning("Note that the results between " +
+                      "0.5, 1, 2, and 4 years are extrapolated, " +
+                      "might be non-physical.")
+    # Evaluate the polynomial in log(f/mHz) by Horner's rule, so the
+    # logarithm is only taken once and no powers are needed. The fit is
+    # zero outside 0.1 mHz <= f <= 10 mHz, and the grid is sorted, so it
+    # is only evaluated on that slice of the grid.
+    coeffs = [fit(duration) for fit in _taiji_confusion_fits()]
+    kmin = np.searchsorted(fr, 1e-4, side='left')
+    kmax = np.searchsorted(fr, 1e-2, side='right')
+    sh_confusion = np.zeros(len(fr))
+    log_f = np.log(fr[kmin:kmax]*1e3)
+    sh_confusion[kmin:kmax] = np.exp(
+        np.polynomial.polynomial.polyval(log_f, coeffs))
+
+    return sh_confusion
+
+
 def confusion_fit_taiji(length, delta_f, low_freq_cutoff, duration=1.0):
     """ The Taiji's sensitivity curve for Galactic confusion noise,
     averaged over sky and polarization angle. No instrumental noise.
@@ -1398,39 +2042,60 @@ def confusion_fit_taiji(length, delta_f, low_freq_cutoff, duration=1.0):
         Please see Eq.(6) and Table(I) in <10.1103/PhysRevD.107.064021>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    t_obs = [0.5, 1, 2, 4]
-    a0 = [-85.3498, -85.4336, -85.3919, -85.5448]
-    a1 = [-2.64899, -2.46276, -2.69735, -3.23671]
-    a2 = [-0.0699707, -0.183175, -0.749294, -1.64187]
-    a3 = [-0.478447, -0.884147, -1.15302, -1.14711]
-    a4 = [-0.334821, -0.427176, -0.302761, 0.0325887]
-    a5 = [0.0658353, 0.128666, 0.175521, 0.187854]
-    fit_a0 = interp1d(t_obs, a0, kind='cubic', fill_value="extrapolate")
-    fit_a1 = interp1d(t_obs, a1, kind='cubic', fill_value="extrapolate")
-    fit_a2 = interp1d(t_obs, a2, kind='cubic', fill_value="extrapolate")
-    fit_a3 = interp1d(t_obs, a3, kind='cubic', fill_value="extrapolate")
-    fit_a4 = interp1d(t_obs, a4, kind='cubic', fill_value="extrapolate")
-    fit_a5 = interp1d(t_obs, a5, kind='cubic', fill_value="extrapolate")
-    if duration not in t_obs:
-        raise Warning("Note that the results between " +
-                      "0.5, 1, 2, and 4 years are extrapolated, " +
-                      "might be non-physical.")
-    sh_confusion = np.exp(
-        fit_a0(duration) +
-        fit_a1(duration) * np.log(fr*1e3) +
-        fit_a2(duration) * np.log(fr*1e3)**2 +
-        fit_a3(duration) * np.log(fr*1e3)**3 +
-        fit_a4(duration) * np.log(fr*1e3)**4 +
-        fit_a5(duration) * np.log(fr*1e3)**5
-    )
-    sh_confusion[(fr < 1e-4) | (fr > 1e-2)] = 0
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sh_confusion = _confusion_fit_taiji_array(fr, duration)
     fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
 
 
+def _sensitivity_curve_lisa_confusion_array(fr, len_arm, acc_noise_level,
+                                            oms_noise_level, base_model,
+                                            duration, response_grid=None):
+    """ The LISA sensitivity curve with Galactic confusion noise, see
+    `sensitivity_curve_lisa_confusion`. The curves are added on the
+    frequency grid, so only the final result is converted to a
+    FrequencySeries.
+
+    Parameters
+    ----------
+    fr : numpy.array
+        The frequency grid, as returned by `_frequency_grid`.
+    len_arm : float
+        The arm length of LISA, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    base_model : string
+        The base model of sensitivity curve, chosen from "semi" or "SciRD".
+    duration : float
+        The duration of observation, between 0 and 10, in the unit of years.
+    response_grid : tuple, optional
+        LISA's response on the grid, as returned by `_response_grid`,
+        if the caller already has it.
+
+    Returns
+    -------
+    sense_curve : numpy.array
+        The curve on the frequency grid of `_frequency_grid`.
+    """
+    if base_model == "semi":
+        sense_curve = _sensitivity_curve_analytical_array(
+            fr, len_arm, acc_noise_level, oms_noise_level, lisa_psd_components,
+            averaged_lisa_fplus_sq_numerical, response_grid)
+    elif base_model == "SciRD":
+        sense_curve = _sensitivity_curve_lisa_SciRD_array(fr)
+    else:
+        raise ValueError("Must choose from 'semi' or 'SciRD'.")
+    if duration < 0 or duration > 10:
+        raise ValueError("Must between 0 and 10.")
+    sense_curve += _confusion_fit_lisa_array(fr, duration)
+
+    return sense_curve
+
+
 def sensitivity_curve_lisa_confusion(length, delta_f, low_freq_cutoff,
                                      len_arm=2.5e9, acc_noise_level=3e-15,
                                      oms_noise_level=15e-12,
@@ -1466,21 +2131,10 @@ def sensitivity_curve_lisa_confusion(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(85-86) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    if base_model == "semi":
-        base_curve = sensitivity_curve_lisa_semi_analytical(
-            length, delta_f, low_freq_cutoff,
-            len_arm, acc_noise_level, oms_noise_level)
-    elif base_model == "SciRD":
-        base_curve = sensitivity_curve_lisa_SciRD(
-            length, delta_f, low_freq_cutoff)
-    else:
-        raise ValueError("Must choose from 'semi' or 'SciRD'.")
-    if duration < 0 or duration > 10:
-        raise ValueError("Must between 0 and 10.")
-    fseries_confusion = confusion_fit_lisa(
-        length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_lisa_confusion_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, base_model, duration)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
@@ -1516,15 +2170,14 @@ def sensitivity_curve_tianqin_confusion(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged
         TianQin's sensitivity curve with Galactic confusion noise.
     """
-    base_curve = sensitivity_curve_tianqin_analytical(
-        length, delta_f, low_freq_cutoff,
-        len_arm, acc_noise_level, oms_noise_level)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_analytical_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, tianqin_psd_components,
+        averaged_tianqin_fplus_sq_numerical)
     if duration < 0 or duration > 5:
         raise ValueError("Must between 0 and 5.")
-    fseries_confusion = confusion_fit_tianqin(
-        length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
+    sense_curve += _confusion_fit_tianqin_array(fr, duration)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
@@ -1559,15 +2212,14 @@ def sensitivity_curve_taiji_confusion(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged
         Taiji's sensitivity curve with Galactic confusion noise.
     """
-    base_curve = sensitivity_curve_taiji_analytical(
-        length, delta_f, low_freq_cutoff,
-        len_arm, acc_noise_level, oms_noise_level)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    sense_curve = _sensitivity_curve_analytical_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, taiji_psd_components,
+        averaged_fplus_sq_approximated)
     if duration < 0 or duration > 4:
         raise ValueError("Must between 0 and 4.")
-    fseries_confusion = confusion_fit_taiji(
-        length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
+    sense_curve += _confusion_fit_taiji_array(fr, duration)
+    fseries = from_numpy_arrays(fr, sense_curve,
                                 length, delta_f, low_freq_cutoff)
 
     return fseries
@@ -1611,20 +2263,23 @@ def sh_transformed_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(7,41-43) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
-        response = averaged_response_lisa_tdi(fr, len_arm, tdi)
+        response_grid = _response_grid(averaged_lisa_fplus_sq_numerical, fr,
+                                       float(len_arm),
+                                       cosine=str(tdi) == "2.0")
+        omega_len, sin_wl, cos_wl, fp_sq = response_grid
+        response = _averaged_response_tdi(omega_len, fp_sq, tdi,
+                                          sin_wl, cos_wl)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
-    sh = sensitivity_curve_lisa_confusion(length, delta_f, low_freq_cutoff,
-                                          len_arm, acc_noise_level,
-                                          oms_noise_level, base_model,
-                                          duration)
-    psd = 2*sh.data * fseries_response.data
-    fseries = from_numpy_arrays(sh.sample_frequencies, psd,
-                                length, delta_f, low_freq_cutoff)
+    # The sensitivity curve uses the same response grid
+    psd = _sensitivity_curve_lisa_confusion_array(
+        fr, len_arm, acc_noise_level, oms_noise_level, base_model, duration,
+        response_grid)
+    psd *= response
+    psd *= 2
+    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
 
     return fseries
 
@@ -1656,18 +2311,19 @@ def semi_analytical_psd_lisa_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for LISA Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
-        response = averaged_response_lisa_tdi(fr, len_arm, tdi)
+        omega_len, sin_wl, cos_wl, fp_sq = _response_grid(
+            averaged_lisa_fplus_sq_numerical, fr, float(len_arm),
+            cosine=str(tdi) == "2.0")
+        response = _averaged_response_tdi(omega_len, fp_sq, tdi,
+                                          sin_wl, cos_wl)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
-    fseries_confusion = confusion_fit_lisa(
-        length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
+    psd_confusion = _confusion_fit_lisa_array(fr, duration)
+    psd_confusion *= response
+    psd_confusion *= 2
+    fseries = from_numpy_arrays(fr, psd_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
@@ -1700,18 +2356,19 @@ def analytical_psd_tianqin_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for TianQin Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
-        response = averaged_response_tianqin_tdi(fr, len_arm, tdi)
+        omega_len, sin_wl, cos_wl, fp_sq = _response_grid(
+            averaged_tianqin_fplus_sq_numerical, fr, float(len_arm),
+            cosine=str(tdi) == "2.0")
+        response = _averaged_response_tdi(omega_len, fp_sq, tdi,
+                                          sin_wl, cos_wl)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
-    fseries_confusion = confusion_fit_tianqin(
-        length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
+    psd_confusion = _confusion_fit_tianqin_array(fr, duration)
+    psd_confusion *= response
+    psd_confusion *= 2
+    fseries = from_numpy_arrays(fr, psd_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
@@ -1744,18 +2401,19 @@ def analytical_psd_taiji_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for Taiji Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
-        response = averaged_response_taiji_tdi(fr, len_arm, tdi)
+        omega_len, sin_wl, cos_wl, fp_sq = _response_grid(
+            averaged_fplus_sq_approximated, fr, float(len_arm),
+            cosine=str(tdi) == "2.0")
+        response = _averaged_response_tdi(omega_len, fp_sq, tdi,
+                                          sin_wl, cos_wl)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
-    fseries_confusion = confusion_fit_taiji(
-        length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
+    psd_confusion = _confusion_fit_taiji_array(fr, duration)
+    psd_confusion *= response
+    psd_confusion *= 2
+    fseries = from_numpy_arrays(fr, psd_confusion, length, delta_f,
                                 low_freq_cutoff)
 
     return fseries
@@ -1802,7 +2460,9 @@ def analytical_psd_lisa_tdi_AE_confusion(length, delta_f, low_freq_cutoff,
     # S_A = S_E = S_X - S_XY, confusion noise's contribution to
     # S_XY is -0.5 * psd_X_confusion, while for S_X is psd_X_confusion.
     # S_T = S_X + 2*S_XY, so S_T keeps the same.
-    fseries = psd_AE + 1.5 * psd_X_confusion
+    fseries = psd_X_confusion
+    fseries *= 1.5
+    fseries += psd_AE
 
     return fseries
 
@@ -1850,7 +2510,9 @@ def analytical_psd_tianqin_tdi_AE_confusion(length, delta_f, low_freq_cutoff,
     # S_A = S_E = S_X - S_XY, confusion noise's contribution to
     # S_XY is -0.5 * psd_X_confusion, while for S_X is psd_X_confusion.
     # S_T = S_X + 2*S_XY, so S_T keeps the same.
-    fseries = psd_AE + 1.5 * psd_X_confusion
+    fseries = psd_X_confusion
+    fseries *= 1.5
+    fseries += psd_AE
 
     return fseries
 
@@ -1896,6 +2558,8 @@ def analytical_psd_taiji_tdi_AE_confusion(length, delta_f, low_freq_cutoff,
     # S_A = S_E = S_X - S_XY, confusion noise's contribution to
     # S_XY is -0.5 * psd_X_confusion, while for S_X is psd_X_confusion.
     # S_T = S_X + 2*S_XY, so S_T keeps the same.
-    fseries = psd_AE + 1.5 * psd_X_confusion
+    fseries = psd_X_confusion
+    fseries *= 1.5
+    fseries += psd_AE
 
     return fseries
@@ -1,14 +1,168 @@
 """ PSD Variation """
 
+import functools
 import numpy
-from numpy.fft import rfft, irfft
+from scipy.fft import rfft, irfft, next_fast_len
 import scipy.signal as sig
-from scipy.interpolate import interp1d
 
 import pycbc.psd
+import pycbc.scheme
 from pycbc.types import TimeSeries
 
 
+def _fft_workers():
+    """The number of threads to use for the FFTs, as set by the current
+    processing scheme.
+    """
+    return getattr(pycbc.scheme.mgr.state, 'num_threads', 1)
+
+
+@functools.lru_cache(maxsize=8)
+def _bandpass_filter(srate, low_freq, high_freq, psd_duration):
+    """Create the magnitude response of the bandpass filter used to find
+    the PSD variation. This depends only on the configuration, not on the
+    data, so it is designed once and cached.
+
+    Parameters
+    ----------
+    srate : int
+        The sample rate of the data.
+    low_freq : float
+        The lower frequency of the bandpass.
+    high_freq : float
+        The upper frequency of the bandpass.
+    psd_duration : float
+        The duration of the estimated PSD.
+
+    Returns
+    -------
+    filt : numpy.ndarray
+        The absolute value of the filter's Fourier transform, sampled at
+        the PSD frequencies. This is shared between callers, so it is
+        marked read-only.
+    """
+    # Create a bandpass filter between low_freq and high_freq
+    filt = sig.firwin(4 * srate, [low_freq, high_freq], pass_zero=False,
+                      window='hann', fs=srate)
+    # Fourier transform the filter, zero-padded (or cut) to the PSD
+    # duration so that it is sampled at the PSD frequencies, and take the
+    # absolute value to get rid of the phase.
+    filt = abs(rfft(filt, n=int(psd_duration * srate)))
+    filt.flags.writeable = False
+    return filt
+
+
+@functools.lru_cache(maxsize=8)
+def _hann_window(length):
+    """Return a read-only Hann window of the given length, cached as the
+    filter length is fixed by the configuration.
+    """
+    window = sig.windows.hann(length)
+    window.flags.writeable = False
+    return window
+
+
+@functools.lru_cache(maxsize=8)
+def _shift_phase(n_freqs, shift):
+    """Return the phase that delays a real signal of 2 * (n_freqs - 1)
+    samples by shift samples, circularly, when applied to its real
+    Fourier transform.
+
+    Parameters
+    ----------
+    n_freqs : int
+        The number of frequencies of the transform.
+    shift : int
+        The number of samples to shift by.
+
+    Returns
+    -------
+    phase : numpy.ndarray
+        The phase at each frequency. This is shared between callers, so
+        it is marked read-only.
+    """
+    phase = numpy.arange(n_freqs) * (shift / (2. * (n_freqs - 1)))
+    # Keep the argument in [0, 1) turns, for accuracy
+    phase %= 1
+    phase = numpy.exp(-2j * numpy.pi * phase)
+    phase.flags.writeable = False
+    return phase
+
+
+class PSDVariationFilter(object):
+    """A filter used to find the PSD variation, together with its Fourier
+    transform.
+
+    In the Live search the filter only changes when the PSD is
+    re-estimated, while it is convolved with every increment of data, so
+    its Fourier transform is computed once for each FFT length and reused.
+    The filter is designed in double precision, but it is applied in the
+    precision of the data.
+
+    Parameters
+    ----------
+    full_filt : numpy.ndarray
+        The complete filter to be convolved with the strain data.
+    """
+    def __init__(self, full_filt):
+        self.full_filt = full_filt
+        self._fft_cache = {}
+
+    def __len__(self):
+        return len(self.full_filt)
+
+    def __array__(self, dtype=None, copy=None):
+        return numpy.asarray(self.full_filt, dtype=dtype)
+
+    def fft(self, fft_len, dtype=numpy.float64):
+        """Return the real Fourier transform of the zero-padded filter.
+
+        Parameters
+        ----------
+        fft_len : int
+            The length of the transform.
+        dtype : numpy.dtype
+            The real type of the data the filter is applied to; the
+            transform is computed in the same precision.
+
+        Returns
+        -------
+        filt_fft : numpy.ndarray
+            The transform of the filter. This is shared between calls, so
+            it is marked read-only.
+        """
+        key = (fft_len, numpy.dtype(dtype))
+        if key not in self._fft_cache:
+            filt_fft = rfft(self.full_filt.astype(dtype, copy=False),
+                            n=fft_len, workers=_fft_workers())
+            filt_fft.flags.writeable = False
+            self._fft_cache[key] = filt_fft
+        return self._fft_cache[key]
+
+    def convolve(self, data):
+        """Convolve data with the filter, keeping the central part of the
+        same length as the data, as `scipy.signal.fftconvolve` does with
+        mode='same'.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The data to filter.
+
+        Returns
+        -------
+        filtered : numpy.ndarray
+            The filtered data, in the precision of the data.
+        """
+        fft_len = next_fast_len(len(data) + len(self) - 1, real=True)
+        workers = _fft_workers()
+        filtered = rfft(data, n=fft_len, workers=workers)
+        filtered *= self.fft(fft_len, dtype=data.dtype)
+        filtered = irfft(filtered, n=fft_len, workers=workers)
+        start = (len(self) - 1) // 2
+        return filtered[start:start + len(data)]
+
+
 def create_full_filt(freqs, filt, plong, srate, psd_duration):
     """Create a filter to convolve with strain data to find PSD variation.
 
@@ -37,17 +191,38 @@ def create_full_filt(freqs, filt, plong, srate, psd_duration):
     # already has a variance of one.
     fweight = freqs ** (-7./6.) * filt / numpy.sqrt(plong)
     fweight[0] = 0.
-    norm = (sum(abs(fweight) ** 2) / (len(fweight) - 1.)) ** -0.5
-    fweight = norm * fweight
+    norm = (numpy.dot(fweight, fweight) / (len(fweight) - 1.)) ** -0.5
+    fweight *= norm
     fwhiten = numpy.sqrt(2. / srate) / numpy.sqrt(plong)
     fwhiten[0] = 0.
-    full_filt = sig.windows.hann(int(psd_duration * srate)) * numpy.roll(
-        irfft(fwhiten * fweight), int(psd_duration / 2) * srate)
+    # Centre the filter by shifting it through a phase in the frequency
+    # domain, rather than rolling the filter after the transform
+    phase = _shift_phase(len(fweight), int(psd_duration / 2) * srate)
+    full_filt = irfft(fwhiten * fweight * phase, workers=_fft_workers())
+    full_filt *= _hann_window(int(psd_duration * srate))
 
     return full_filt
 
 
-def mean_square(data, delta_t, srate, short_stride, stride):
+def _replace_outliers(short_ms):
+    """Replace outliers due to short glitches, in place along the last
+    axis. An outlier is any element which is greater than two times the
+    average of its closest neighbours, and is substituted with that
+    average. The averages are all taken before any substitution.
+
+    Parameters
+    ----------
+    short_ms : numpy.ndarray
+        The mean square of the data once per short stride.
+    """
+    # Define an array of averages that is used to substitute outliers
+    ave = short_ms[..., 2:] + short_ms[..., :-2]
+    ave *= 0.5
+    numpy.copyto(short_ms[..., 1:-1], ave,
+                 where=short_ms[..., 1:-1] > (2. * ave))
+
+
+def mean_square(data, delta_t, srate, short_stride, stride, out=None):
     """ Calculate mean square of given time series once per stride
 
     First of all this function calculate the mean square of given time
@@ -70,29 +245,36 @@ def mean_square(data, delta_t, srate, short_stride, stride):
         Stride duration for outlier removal
     stride ; float
         Stride duration
+    out : numpy.ndarray, optional
+        If given, the mean squares are written to the start of this
+        array, which must be long enough to hold them.
 
     Returns
     -------
-    m_s: List
-        Mean square of given time series
+    m_s: numpy.ndarray
+        Mean square of given time series. If out is given, this is a view
+        of its start.
     """
 
-    # Calculate mean square of data once per short stride and replace
-    # outliers
-    short_ms = numpy.mean(data.reshape(-1, int(srate * short_stride)) ** 2,
-                          axis=1)
-    # Define an array of averages that is used to substitute outliers
-    ave = 0.5 * (short_ms[2:] + short_ms[:-2])
-    outliers = short_ms[1:-1] > (2. * ave)
-    short_ms[1:-1][outliers] = ave[outliers]
+    # Calculate mean square of data once per short stride, without
+    # forming the squared data, and replace outliers
+    blocks = data.reshape(-1, int(srate * short_stride))
+    short_ms = numpy.einsum('ij,ij->i', blocks, blocks)
+    short_ms /= blocks.shape[1]
+    _replace_outliers(short_ms)
 
     # Calculate mean square of data every step within a window equal to
-    # stride seconds
-    m_s = []
+    # stride seconds, as the mean of a strided view of windows
     inv_time = int(1. / short_stride)
-    for index in range(int(delta_t - stride + 1)):
-        m_s.append(numpy.mean(short_ms[inv_time * index:inv_time *
-                                       int(index+stride)]))
+    n_steps = max(int(delta_t - stride + 1), 0)
+    if out is not None:
+        out = out[:n_steps]
+    if n_steps == 0:
+        # The data are shorter than a single stride
+        return numpy.zeros(0, dtype=short_ms.dtype) if out is None else out
+    windows = numpy.lib.stride_tricks.sliding_window_view(
+        short_ms, inv_time * int(stride))
+    m_s = windows[::inv_time][:n_steps].mean(axis=1, out=out)
     return m_s
 
 
@@ -163,14 +345,18 @@ def calc_filt_psd_variation(strain, segment, short_segment, psd_long_segment,
                               - segment + step)
 
     # Create a bandpass filter between low_freq and high_freq
-    filt = sig.firwin(4 * srate, [low_freq, high_freq], pass_zero=False,
-                      window='hann', fs=srate)
-    filt.resize(int(psd_duration * srate))
-    # Fourier transform the filter and take the absolute value to get
-    # rid of the phase.
-    filt = abs(rfft(filt))
-
-    psd_var_list = []
+    filt = _bandpass_filter(srate, low_freq, high_freq, psd_duration)
+
+    # Every long segment gives at most this many values, one per step,
+    # which are written straight into the output array
+    n_per_segment = max(int(psd_long_segment - 2 * strain_crop
+                            - segment + step), 0)
+    psd_var_array = numpy.empty(len(times_long) * n_per_segment,
+                                dtype=fs_dtype)
+    n_filled = 0
+    # The last long segments all use the PSD of the final
+    # psd_long_segment of data, so it is only estimated once.
+    end_psd = None
     for tlong in times_long:
         # Calculate PSD for long segment
         if tlong + psd_long_segment <= float(end_time):
@@ -182,28 +368,35 @@ def calc_filt_psd_variation(strain, segment, short_segment, psd_long_segment,
                 avg_method=psd_avg_method)
         else:
             astrain = strain.time_slice(tlong, end_time)
-            plong = pycbc.psd.welch(
+            if end_psd is None:
+                end_psd = pycbc.psd.welch(
                            strain.time_slice(end_time - psd_long_segment,
                                              end_time),
                            seg_len=int(psd_duration * strain.sample_rate),
                            seg_stride=int(psd_stride * strain.sample_rate),
                            avg_method=psd_avg_method)
+            plong = end_psd
         astrain = astrain.numpy()
         freqs = numpy.array(plong.sample_frequencies, dtype=fs_dtype)
         plong = plong.numpy()
 
         full_filt = create_full_filt(freqs, filt, plong, srate, psd_duration)
-        # Convolve the filter with long segment of data
-        wstrain = sig.fftconvolve(astrain, full_filt, mode='same')
+        # Convolve the filter with long segment of data. The filter is new
+        # for every segment and much shorter than the data, so overlap-add
+        # is quicker than a single transform of the whole segment.
+        wstrain = sig.oaconvolve(astrain,
+                                 full_filt.astype(astrain.dtype, copy=False),
+                                 mode='same')
         wstrain = wstrain[int(strain_crop * srate):-int(strain_crop * srate)]
         # compute the mean square of the chunk of data
         delta_t = len(wstrain) * strain.delta_t
-        variation = mean_square(wstrain, delta_t, srate, short_segment, segment)
-        psd_var_list.append(numpy.array(variation, dtype=wstrain.dtype))
+        variation = mean_square(wstrain, delta_t, srate, short_segment,
+                                segment, out=psd_var_array[n_filled:])
+        n_filled += len(variation)
 
     # Package up the time series to return
-    psd_var = TimeSeries(numpy.concatenate(psd_var_list), delta_t=step,
-                         epoch=start_time + strain_crop + segment)
+    psd_var = TimeSeries(psd_var_array[:n_filled], delta_t=step,
+                         epoch=start_time + strain_crop + segment, copy=False)
 
     return psd_var
 
@@ -232,13 +425,10 @@ def find_trigger_value(psd_var, idx, start, sample_rate):
     time = start + idx / sample_rate
     # Extract the PSD variation at trigger time through linear
     # interpolation
-    if not hasattr(psd_var, 'cached_psd_var_interpolant'):
-        psd_var.cached_psd_var_interpolant = \
-            interp1d(psd_var.sample_times.numpy(),
-                     psd_var.numpy(),
-                     fill_value=1.0,
-                     bounds_error=False)
-    vals = psd_var.cached_psd_var_interpolant(time)
+    if not hasattr(psd_var, 'cached_psd_var_sample_times'):
+        psd_var.cached_psd_var_sample_times = psd_var.sample_times.numpy()
+    vals = numpy.interp(time, psd_var.cached_psd_var_sample_times,
+                        psd_var.numpy(), left=1.0, right=1.0)
 
     return vals
 
@@ -273,30 +463,61 @@ def live_create_filter(psd_estimated,
 
     Returns
     -------
-    full_filt : numpy.ndarray
+    full_filt : PSDVariationFilter
         The complete filter to be convolved with the strain data to
-        find the psd variation value.
+        find the psd variation value. It can be converted to a
+        numpy.ndarray with `numpy.asarray`.
 
     """
 
-    # Create a bandpass filter between low_freq and high_freq once
-    filt = sig.firwin(4 * sample_rate,
-                      [low_freq, high_freq],
-                      pass_zero=False,
-                      window='hann',
-                      fs=sample_rate)
-    filt.resize(int(psd_duration * sample_rate))
-
-    # Fourier transform the filter and take the absolute value to get
-    #  rid of the phase.
-    filt = abs(rfft(filt))
+    # Create a bandpass filter between low_freq and high_freq. This is
+    #  the same for every PSD update, so it is only designed once.
+    filt = _bandpass_filter(sample_rate, low_freq, high_freq, psd_duration)
 
     # Extract the psd frequencies to create a representative filter.
     freqs = numpy.array(psd_estimated.sample_frequencies, dtype=numpy.float32)
     plong = psd_estimated.numpy()
     full_filt = create_full_filt(freqs, filt, plong, sample_rate, psd_duration)
 
-    return full_filt
+    return PSDVariationFilter(full_filt)
+
+
+def _live_mean_square(wstrain, sample_rate, short_stride):
+    """Average the filtered Live data to one PSD variation value per
+    second, along the last axis.
+
+    Parameters
+    ----------
+    wstrain : numpy.ndarray
+        The data convolved with the PSD variation filter. Several
+        detectors can be given as the rows of a 2D array.
+    sample_rate : int
+        The sample rate of the data.
+    short_stride : float
+        The number of seconds to average over to remove the effects of
+        short duration glitches.
+
+    Returns
+    -------
+    m_s : numpy.ndarray
+        The PSD variation values.
+    """
+    # Create a PSD variation array by taking the mean square of the PSD
+    #  variation timeseries every short_stride
+    blocks = wstrain.reshape(wstrain.shape[:-1]
+                             + (-1, int(sample_rate * short_stride)))
+    short_ms = numpy.einsum('...ij,...ij->...i', blocks, blocks)
+    short_ms /= blocks.shape[-1]
+
+    _replace_outliers(short_ms)
+
+    # Calculate the PSD variation every second by a moving window average
+    # containing (1/short_stride) short_ms samples.
+    samples_per_second = int(1 / short_stride)
+    n_seconds = short_ms.shape[-1] // samples_per_second
+    m_s = short_ms[..., :n_seconds * samples_per_second].reshape(
+        short_ms.shape[:-1] + (n_seconds, samples_per_second)).mean(axis=-1)
+    return m_s.astype(wstrain.dtype, copy=False)
 
 
 def live_calc_psd_variation(strain,
@@ -318,7 +539,7 @@ def live_calc_psd_variation(strain,
     ----------
     strain : pycbc.timeseries
         Live data being searched through by the PyCBC Live search.
-    full_filt : numpy.ndarray
+    full_filt : PSDVariationFilter or numpy.ndarray
         A filter created by `live_create_filter`.
     increment : float
         The number of seconds in each increment in the PyCBC Live search.
@@ -343,29 +564,13 @@ def live_calc_psd_variation(strain,
 
     # Convolve the data and the filter to produce the PSD variation timeseries,
     #  then trim the beginning and end of the data to prevent edge effects.
-    wstrain = sig.fftconvolve(astrain, full_filt, mode='same')
+    #  The filter keeps its transform from earlier calls.
+    if not isinstance(full_filt, PSDVariationFilter):
+        full_filt = PSDVariationFilter(full_filt)
+    wstrain = full_filt.convolve(astrain.numpy())
     wstrain = wstrain[int(data_trim * sample_rate):-int(data_trim * sample_rate)]
 
-    # Create a PSD variation array by taking the mean square of the PSD
-    #  variation timeseries every short_stride
-    short_ms = numpy.mean(
-        wstrain.reshape(-1, int(sample_rate * short_stride)) ** 2, axis=1)
-
-    # Define an array of averages that is used to substitute outliers
-    ave = 0.5 * (short_ms[2:] + short_ms[:-2])
-    outliers = short_ms[1:-1] > (2. * ave)
-    short_ms[1:-1][outliers] = ave[outliers]
-
-    # Calculate the PSD variation every second by a moving window average
-    # containing (1/short_stride) short_ms samples.
-    m_s = []
-    samples_per_second = 1 / short_stride
-    for idx in range(int(len(short_ms) / samples_per_second)):
-        start = int(samples_per_second * idx)
-        end = int(samples_per_second * (idx + 1))
-        m_s.append(numpy.mean(short_ms[start:end]))
-
-    m_s = numpy.array(m_s, dtype=wstrain.dtype)
+    m_s = _live_mean_square(wstrain, sample_rate, short_stride)
     psd_var = TimeSeries(m_s,
                          delta_t=1.0,
                          epoch=strain.end_time - increment - (data_trim * 2))
@@ -373,6 +578,87 @@ def live_calc_psd_variation(strain,
     return psd_var
 
 
+def live_calc_psd_variation_batched(strains,
+                                    full_filts,
+                                    increment,
+                                    data_trim=2.0,
+                                    short_stride=0.25):
+    """
+    Calculate the psd variation of several detectors in the PyCBC Live search.
+
+    This gives the same result as calling `live_calc_psd_variation` for each
+    detector, but the data of all the detectors are Fourier transformed
+    together. If the detectors' data or filters have different lengths, each
+    detector is processed separately.
+
+    Parameters
+    ----------
+    strains : dict
+        Dictionary of the Live data being searched through by the PyCBC Live
+        search, keyed by detector.
+    full_filts : dict
+        Dictionary of the filters created by `live_create_filter`, keyed by
+        detector.
+    increment : float
+        The number of seconds in each increment in the PyCBC Live search.
+    data_trim : float
+        The number of seconds to be trimmed from either end of the convolved
+        timeseries to prevent artefacts.
+    short_stride : float
+        The number of seconds to average the PSD variation timeseries over to
+        remove the effects of short duration glitches.
+
+    Returns
+    -------
+    psd_vars : dict
+        Dictionary of the timeseries containing the PSD variation values,
+        keyed by detector.
+    """
+    ifos = list(strains)
+    filts = {}
+    astrains = {}
+    for ifo in ifos:
+        filts[ifo] = full_filts[ifo]
+        if not isinstance(filts[ifo], PSDVariationFilter):
+            filts[ifo] = PSDVariationFilter(filts[ifo])
+        strain = strains[ifo]
+        astrains[ifo] = strain.time_slice(
+            strain.end_time - increment - (data_trim * 3), strain.end_time)
+
+    sample_rates = {int(strains[ifo].sample_rate) for ifo in ifos}
+    data_lens = {len(astrains[ifo]) for ifo in ifos}
+    filt_lens = {len(filts[ifo]) for ifo in ifos}
+    if len(sample_rates) != 1 or len(data_lens) != 1 or len(filt_lens) != 1:
+        return {ifo: live_calc_psd_variation(strains[ifo], filts[ifo],
+                                             increment, data_trim=data_trim,
+                                             short_stride=short_stride)
+                for ifo in ifos}
+    sample_rate = sample_rates.pop()
+    data_len = data_lens.pop()
+    filt_len = filt_lens.pop()
+
+    # Convolve the data of each detector with its filter, as in
+    #  `PSDVariationFilter.convolve`, with one transform of all the data.
+    fft_len = next_fast_len(data_len + filt_len - 1, real=True)
+    workers = _fft_workers()
+    data = numpy.stack([astrains[ifo].numpy() for ifo in ifos])
+    wstrain = rfft(data, n=fft_len, axis=-1, workers=workers)
+    wstrain *= numpy.stack([filts[ifo].fft(fft_len, dtype=data.dtype)
+                            for ifo in ifos])
+    wstrain = irfft(wstrain, n=fft_len, axis=-1, workers=workers)
+    start = (filt_len - 1) // 2 + int(data_trim * sample_rate)
+    end = start + data_len - 2 * int(data_trim * sample_rate)
+    m_s = _live_mean_square(wstrain[:, start:end], sample_rate, short_stride)
+
+    psd_vars = {}
+    for i, ifo in enumerate(ifos):
+        psd_vars[ifo] = TimeSeries(
+            m_s[i], delta_t=1.0,
+            epoch=strains[ifo].end_time - increment - (data_trim * 2))
+
+    return psd_vars
+
+
 def live_find_var_value(triggers,
                         psd_var_timeseries):
     """
@@ -392,12 +678,10 @@ def live_find_var_value(triggers,
         Array of interpolated PSD variation values at trigger times.
     """
 
-    # Create the interpolator
-    interpolator = interp1d(psd_var_timeseries.sample_times.numpy(),
-                            psd_var_timeseries.numpy(),
-                            fill_value=1.0,
-                            bounds_error=False)
     # Evaluate at the trigger times
-    psd_var_vals = interpolator(triggers['end_time'])
+    psd_var_vals = numpy.interp(triggers['end_time'],
+                                psd_var_timeseries.sample_times.numpy(),
+                                psd_var_timeseries.numpy(),
+                                left=1.0, right=1.0)
 
     return psd_var_vals
@@ -69,10 +69,14 @@ def load_html_metadata(filename):
 def save_png_with_metadata(fig, filename, fig_kwds, kwds):
     """ Save a matplotlib figure to a png with metadata
     """
+    from io import BytesIO
     from PIL import Image, PngImagePlugin
-    fig.savefig(filename, **fig_kwds)
+    # Render in memory so that the file is written only once, with metadata
+    buf = BytesIO()
+    fig.savefig(buf, format='png', **fig_kwds)
+    buf.seek(0)
 
-    im = Image.open(filename)
+    im = Image.open(buf)
     meta = PngImagePlugin.PngInfo()
 
     for key in kwds:
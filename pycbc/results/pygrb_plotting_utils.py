@@ -23,7 +23,6 @@
 Module to generate PyGRB figures: scatter plots and timeseries.
 """
 
-import copy
 import numpy
 import igwn_segments as segments
 from pycbc.results import save_fig_with_metadata
@@ -195,11 +194,12 @@ def pygrb_plotter(trigs, injs, xlabel, ylabel, opts,
     # Set up plot
     fig = plt.figure()
     cax = fig.gca()
-    # Plot trigger-related and (if present) injection-related quantities
+    # Plot trigger-related and (if present) injection-related quantities:
+    # the markers are rasterized to keep vector outputs small and quick to save
     cax_plotter = cax.loglog if opts.use_logs else cax.plot
-    cax_plotter(trigs[0], trigs[1], 'bx')
+    cax_plotter(trigs[0], trigs[1], 'bx', rasterized=True)
     if not (injs[0] is None and injs[1] is None):
-        cax_plotter(injs[0], injs[1], 'r+')
+        cax_plotter(injs[0], injs[1], 'r+', rasterized=True)
     cax.grid()
     # Plot contours
     if conts is not None:
@@ -207,10 +207,9 @@ def pygrb_plotter(trigs, injs, xlabel, ylabel, opts,
     # Add shading above a specific contour (typically used for vetoed area)
     if shade_cont_value is not None:
         limy = cax.get_ylim()[1]
-        polyx = copy.deepcopy(snr_vals)
-        polyy = copy.deepcopy(conts[shade_cont_value])
-        polyx = numpy.append(polyx, [max(snr_vals), min(snr_vals)])
-        polyy = numpy.append(polyy, [limy, limy])
+        polyx = numpy.concatenate((snr_vals,
+                                   [numpy.max(snr_vals), numpy.min(snr_vals)]))
+        polyy = numpy.concatenate((conts[shade_cont_value], [limy, limy]))
         cax.fill(polyx, polyy, color='#dddddd')
     # Axes: labels and limits
     cax.set_xlabel(xlabel)
@@ -25,7 +25,6 @@ Module to generate PyGRB figures: scatter plots and timeseries.
 
 import logging
 import argparse
-import copy
 import numpy
 import h5py
 import igwn_segments as segments
@@ -185,14 +184,15 @@ def pygrb_add_bestnr_cut_opt(parser):
 # Wrapper to pick triggers with a given slide_id
 # =============================================================================
 # Underscore starts name of functions not called outside this file
-def _slide_filter(trig_file, data, slide_id=None):
+def _slide_filter(slide_ids, data, slide_id=None):
     """
     This function adds the capability to select triggers with specific
-    slide_ids during the postprocessing stage of PyGRB.
+    slide_ids during the postprocessing stage of PyGRB. slide_ids is the
+    network/slide_id dataset of the trigger file.
     """
     if slide_id is None:
         return data
-    mask = numpy.where(trig_file['network/slide_id'][:] == slide_id)[0]
+    mask = numpy.where(slide_ids == slide_id)[0]
     return data[mask]
 
 
@@ -255,9 +255,10 @@ def _extract_vetoes(veto_file, ifos, offsource):
 def _slide_vetoes(vetoes, slide_dict_or_list, slide_id, ifos):
     """Build a dictionary (indexed by ifo) of time-slid vetoes"""
 
-    # Copy vetoes
+    # Copy vetoes: segments are immutable, so shallow copies of the
+    # segment lists are enough to slide them without altering the input
     if vetoes:
-        slid_vetoes = copy.deepcopy(vetoes)
+        slid_vetoes = vetoes.copy()
         # Slide them
         for ifo in ifos:
             slid_vetoes[ifo].shift(-slide_dict_or_list[slide_id][ifo])
@@ -283,6 +284,52 @@ def _dataset_iterator(g, prefix=''):
             yield from _dataset_iterator(item, path)
 
 
+# =============================================================================
+# Function to locate values in an array
+# =============================================================================
+def first_locations(array, values):
+    """Return the index of the first occurrence in array of each of the
+    values, all of which must be present in array."""
+
+    sorter = numpy.argsort(array, kind='stable')
+    positions = numpy.searchsorted(array, values, sorter=sorter)
+    if numpy.any(positions == len(array)) or \
+            not numpy.array_equal(array[sorter[positions]], values):
+        err_msg = "Some values were not found in the array."
+        raise RuntimeError(err_msg)
+
+    return sorter[positions]
+
+
+# =============================================================================
+# Functions to check times and segments against a list of segments
+# =============================================================================
+def _in_segments(times, seg_list):
+    """Return a boolean array flagging which of the times lie within the
+    coalesced segment list seg_list, with the same convention as
+    `time in seg_list`."""
+
+    bounds = numpy.array(seg_list, dtype=numpy.float64).reshape(-1, 2)
+    if not len(bounds):
+        return numpy.zeros(numpy.shape(times), dtype=bool)
+    idx = numpy.searchsorted(bounds[:, 0], times, side='right') - 1
+    return (idx >= 0) & (times < bounds[numpy.maximum(idx, 0), 1])
+
+
+def _intersects_segments(starts, ends, seg_list):
+    """Return a boolean array flagging which of the segments [starts, ends)
+    intersect the coalesced segment list seg_list, with the same convention
+    as `seg_list.intersects_segment`."""
+
+    bounds = numpy.array(seg_list, dtype=numpy.float64).reshape(-1, 2)
+    if not len(bounds):
+        return numpy.zeros(numpy.shape(starts), dtype=bool)
+    # First segment of the list ending after each start
+    idx = numpy.searchsorted(bounds[:, 1], starts, side='right')
+    return (idx < len(bounds)) & \
+        (bounds[numpy.minimum(idx, len(bounds) - 1), 0] < ends)
+
+
 # =============================================================================
 # Function to load trigger/injection data
 # =============================================================================
@@ -334,15 +381,17 @@ def load_data(input_file, ifos, rw_snr_threshold=None, data_tag=None,
 
     # Do not assume that IFO and network datasets are sorted the same way:
     # find where each surviving network/event_id is placed in the IFO/event_id
+    # (its first occurrence), with a single sort of the IFO/event_id
     ifo_ids_above_thresh_locations = {}
     for ifo in ifos:
         ifo_ids_above_thresh_locations[ifo] = \
-            numpy.array([numpy.where(ifo_ids[ifo] == net_id)[0][0]
-                         for net_id in net_ids[above_thresh]])
+            first_locations(ifo_ids[ifo], net_ids[above_thresh])
 
     # Apply the cut on all the data by removing points with reweighted SNR = 0
     trigs_dict = {}
     with HFile(input_file, "r") as trigs:
+        # Read the slide IDs once for all the datasets
+        slide_ids = trigs['network/slide_id'][:]
         for (path, dset) in _dataset_iterator(trigs):
             # The dataset contains search information or missed injections
             # information, not properties of triggers or found injections:
@@ -361,8 +410,8 @@ def load_data(input_file, ifos, rw_snr_threshold=None, data_tag=None,
             else:
                 trigs_dict[path] = dset[above_thresh]
 
-            if trigs_dict[path].size == trigs['network/slide_id'][:].size:
-                trigs_dict[path] = _slide_filter(trigs, trigs_dict[path],
+            if trigs_dict[path].size == slide_ids.size:
+                trigs_dict[path] = _slide_filter(slide_ids, trigs_dict[path],
                                                  slide_id=slide_id)
 
     return trigs_dict
@@ -412,11 +461,13 @@ def apply_vetoes_to_found_injs(found_missed_file, found_injs, ifos,
         logging.info("Applying data vetoes to found injections...")
         for ifo in ifos:
             inj_time = found_injs[ifo+'/end_time'][:]
-            idx, _ = veto.indices_outside_segments(inj_time, [veto_file], ifo, None)
-            veto_idx = numpy.append(veto_idx, idx)
-            logging.info("%d injections vetoed due to %s.", len(idx), ifo)
+            # Read the segments once: the injections outside of them are
+            # the complement of those within them
             idx, _ = veto.indices_within_segments(inj_time, [veto_file], ifo, None)
             found_idx = numpy.intersect1d(found_idx, idx)
+            idx = numpy.delete(numpy.arange(len(inj_time)), idx)
+            veto_idx = numpy.append(veto_idx, idx)
+            logging.info("%d injections vetoed due to %s.", len(idx), ifo)
         veto_idx = numpy.unique(veto_idx)
         logging.info("%d injections vetoed.", len(veto_idx))
         logging.info("%d injections surviving vetoes.", len(found_idx))
@@ -438,19 +489,18 @@ def apply_vetoes_to_found_injs(found_missed_file, found_injs, ifos,
 # * Function to calculate the antenna response F+^2 + Fx^2
 # * Function to calculate the antenna distance factor
 # =============================================================================
-def _get_antenna_single_response(antenna, ra, dec, geocent_time):
-    """Returns the antenna response F+^2 + Fx^2 of an IFO (passed as pycbc
-    Detector type) at a given sky location and time."""
+def get_antenna_responses(antenna, ra, dec, geocent_time):
+    """Returns the antenna responses F+^2 + Fx^2 of an IFO (passed as pycbc
+    Detector type) at the given sky locations and times."""
 
+    # Detector.antenna_pattern operates on whole arrays at once
+    ra, dec, geocent_time = \
+        numpy.broadcast_arrays(numpy.asarray(ra, dtype=float),
+                               numpy.asarray(dec, dtype=float),
+                               numpy.asarray(geocent_time, dtype=float))
     fp, fc = antenna.antenna_pattern(ra, dec, 0, geocent_time)
 
-    return fp**2 + fc**2
-
-
-# Vectorize the function above on all but the first argument
-get_antenna_responses = numpy.vectorize(_get_antenna_single_response,
-                                        otypes=[float])
-get_antenna_responses.excluded.add(0)
+    return numpy.asarray(fp**2 + fc**2, dtype=float)
 
 
 def get_antenna_dist_factor(antenna, ra, dec, geocent_time, inc=0.0):
@@ -472,42 +522,39 @@ def sort_trigs(trial_dict, trigs, slide_dict, seg_dict):
 
     sorted_trigs = {}
 
-    # Begin by sorting the triggers into each slide
-    for slide_id in slide_dict:
-        sorted_trigs[slide_id] = []
-    for slide_id, event_id in zip(trigs['network/slide_id'],
-                                  trigs['network/event_id']):
-        if slide_id in slide_dict:
-            sorted_trigs[slide_id].append(event_id)
+    # Begin by sorting the triggers into each slide: a stable sort by slide
+    # keeps the triggers of each slide in their original order
+    slide_ids = numpy.asarray(trigs['network/slide_id'])
+    order = numpy.argsort(slide_ids, kind='stable')
+    slide_ids = slide_ids[order]
+    event_ids = numpy.asarray(trigs['network/event_id'])[order]
+    end_times = numpy.asarray(trigs['network/end_time_gc'])[order]
+    starts = numpy.searchsorted(slide_ids, list(slide_dict), side='left')
+    ends = numpy.searchsorted(slide_ids, list(slide_dict), side='right')
+
+    for slide_id, start, end in zip(slide_dict, starts, ends):
+        sorted_trigs[slide_id] = event_ids[start:end]
+        slide_end_times = end_times[start:end]
 
-    for slide_id in slide_dict:
         # These can only *reduce* the analysis time
         curr_seg_list = seg_dict[slide_id]
 
-        # Check the triggers are all in the analysed segment lists
-        for event_id in sorted_trigs[slide_id]:
-            index = numpy.flatnonzero(trigs['network/event_id'] == event_id)[0]
-            end_time = trigs['network/end_time_gc'][index]
-            if end_time not in curr_seg_list:
-                # This can be raised if the trigger is on the segment boundary,
-                # so check if the trigger is within 1/100 of a second within
-                # the list
-                if end_time + 0.01 in curr_seg_list:
-                    continue
-                if end_time - 0.01 in curr_seg_list:
-                    continue
-                err_msg = "Triggers found in input files not in the list of "
-                err_msg += "analysed segments. This should not happen."
-                raise RuntimeError(err_msg)
+        # Check the triggers are all in the analysed segment lists.
+        # A trigger on the segment boundary can fail this, so also accept
+        # triggers within 1/100 of a second of the list
+        in_segs = _in_segments(slide_end_times, curr_seg_list) | \
+            _in_segments(slide_end_times + 0.01, curr_seg_list) | \
+            _in_segments(slide_end_times - 0.01, curr_seg_list)
+        if not in_segs.all():
+            err_msg = "Triggers found in input files not in the list of "
+            err_msg += "analysed segments. This should not happen."
+            raise RuntimeError(err_msg)
         # END OF CHECK #
 
         # Keep triggers that are in trial_dict
         num_trigs_before = len(sorted_trigs[slide_id])
-        sorted_trigs[slide_id] = [event_id for event_id in
-                                  sorted_trigs[slide_id]
-                                  if trigs['network/end_time_gc'][
-                                      trigs['network/event_id'] == event_id][0]
-                                  in trial_dict[slide_id]]
+        sorted_trigs[slide_id] = sorted_trigs[slide_id][
+            _in_segments(slide_end_times, trial_dict[slide_id])]
 
         # Check that the number of triggers has not increased after vetoes
         assert len(sorted_trigs[slide_id]) <= num_trigs_before,\
@@ -542,7 +589,7 @@ def extract_trig_properties(trial_dict, trigs, slide_dict, seg_dict, keys):
         indices = numpy.nonzero(
             numpy.isin(trigs['network/event_id'], slide_trigs))[0]
         for key in keys:
-            if slide_trigs:
+            if len(slide_trigs):
                 found_trigs[key][slide_id] = get_coinc_snr(trigs)[indices] \
                     if key == 'network/coincident_snr' else trigs[key][indices]
             else:
@@ -586,10 +633,14 @@ def load_time_slides(hdf_file_path):
     logging.info("Loading timeslides.")
     hdf_file = HFile(hdf_file_path, 'r')
     ifos = extract_ifos(hdf_file_path)
-    ids = numpy.arange(len(hdf_file[f'{ifos[0]}/search/time_slides']))
+    # Read each IFO's time slides once rather than one value at a time
+    time_slides = {ifo: hdf_file[f'{ifo}/search/time_slides'][:]
+                   for ifo in ifos}
+    hdf_file.close()
+    ids = numpy.arange(len(time_slides[ifos[0]]))
     time_slide_dict = {
         slide_id: {
-            ifo: hdf_file[f'{ifo}/search/time_slides'][slide_id]
+            ifo: time_slides[ifo][slide_id]
             for ifo in ifos}
         for slide_id in ids}
 
@@ -678,21 +729,21 @@ def construct_trials(seg_files, seg_dict, ifos, slide_dict, veto_file,
         # Construct trial list and check against buffer
         trial_dict[slide_id] = segments.segmentlist()
         for curr_seg in curr_seg_list:
-            iter_int = 1
-            while 1:
-                trial_end = curr_seg[0] + trial_time*iter_int
-                if trial_end > curr_seg[1]:
-                    break
-                curr_trial = segments.segment(trial_end - trial_time,
-                                              trial_end)
-                if not seg_buffer.intersects_segment(curr_trial):
-                    intersect = numpy.any([slid_vetoes[ifo].
-                                           intersects_segment(curr_trial)
-                                           for ifo in ifos])
-                    if not intersect:
-                        trial_dict[slide_id].append(curr_trial)
-
-                iter_int += 1
+            # Ends of all the consecutive trials fitting in the segment
+            num_trials = int(abs(curr_seg) // trial_time)
+            trial_ends = curr_seg[0] + \
+                trial_time*numpy.arange(1, num_trials + 2)
+            trial_ends = trial_ends[trial_ends <= curr_seg[1]]
+            trial_starts = trial_ends - trial_time
+            # Keep the trials intersecting neither the buffer nor the vetoes
+            keep = ~_intersects_segments(trial_starts, trial_ends, seg_buffer)
+            for ifo in ifos:
+                keep &= ~_intersects_segments(trial_starts, trial_ends,
+                                              slid_vetoes[ifo])
+            trial_dict[slide_id].extend(
+                segments.segment(trial_start, trial_end) for
+                trial_start, trial_end in zip(trial_starts[keep],
+                                              trial_ends[keep]))
 
     total_trials = sum(len(trial_dict[slide_id]) for slide_id in slide_dict)
     logging.info("%d trials generated.", total_trials)
@@ -788,7 +839,15 @@ def template_hash_to_id(trigger_file, bank_path):
     ifos = [k for k in trigger_file.keys() if k != 'network']
     trig_hashes = trigger_file[f'{ifos[0]}/template_hash'][:]
     trig_ids = numpy.zeros(trig_hashes.shape[0], dtype=int)
-    for idx, t_hash in enumerate(hashes):
-        matches = numpy.where(trig_hashes == t_hash)
-        trig_ids[matches] = idx
+    if not len(hashes):
+        return trig_ids
+    # Look up all the trigger hashes in the sorted bank hashes at once: the
+    # stable sort makes a repeated hash map to its last index in the bank,
+    # while hashes missing from the bank keep the index 0
+    sorter = numpy.argsort(hashes, kind='stable')
+    positions = numpy.searchsorted(hashes, trig_hashes, side='right',
+                                   sorter=sorter) - 1
+    positions = sorter[numpy.maximum(positions, 0)]
+    found = hashes[positions] == trig_hashes
+    trig_ids[found] = positions[found]
     return trig_ids
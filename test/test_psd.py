@@ -75,6 +75,161 @@ class TestPSD(unittest.TestCase):
                 self.assertTrue(psd.min() < 1e-40,
                                 msg=(psd_name + ': unreasonably high minimum'))
 
+    def test_analytical_space(self):
+        """Test that the space-borne detectors' analytical PSDs are sampled
+        on the output frequency grid"""
+        from pycbc.psd import analytical_space
+        length, delta_f, flow = 2049, 1e-5, 1e-4
+        kmin = int(flow / delta_f)
+        freqs = numpy.arange(kmin, length) * delta_f
+        s_acc_nu, s_oms_nu = analytical_space.lisa_psd_components(freqs)
+        omega_len = analytical_space.omega_length(freqs, 2.5e9)
+        expected = (16 * numpy.sin(omega_len)**2 *
+                    (s_oms_nu + s_acc_nu * (3 + numpy.cos(2 * omega_len))))
+        tdi2_factor = 4 * numpy.sin(2 * omega_len)**2
+        for tdi, factor in (('1.5', 1.), ('2.0', tdi2_factor)):
+            psd = analytical_space.analytical_psd_lisa_tdi_XYZ(
+                length, delta_f, flow, tdi=tdi)
+            self.assertEqual(len(psd), length)
+            self.assertEqual(psd.delta_f, delta_f)
+            self.assertTrue((psd.numpy()[:kmin] == 0).all())
+            numpy.testing.assert_allclose(psd.numpy()[kmin:],
+                                          expected * factor, rtol=1e-10)
+
+    def test_analytical_space_array_args(self):
+        """Test that the TDI PSDs accept 0-d arrays and strings as
+        parameters"""
+        from pycbc.psd import analytical_space
+        length, delta_f, flow = 100, 1e-4, 1e-4
+        for func in (analytical_space.analytical_psd_lisa_tdi_XYZ,
+                     analytical_space.analytical_psd_tianqin_tdi_AE,
+                     analytical_space.analytical_psd_taiji_tdi_T):
+            expected = func(length, delta_f, flow, tdi='1.5')
+            defaults = func.__defaults__
+            psd = func(length, delta_f, flow,
+                       len_arm=numpy.array(defaults[0]),
+                       acc_noise_level=numpy.array(defaults[1]),
+                       oms_noise_level=numpy.array(defaults[2]), tdi='1.5')
+            numpy.testing.assert_array_equal(psd.numpy(), expected.numpy())
+            psd = func(length, delta_f, flow, len_arm=str(defaults[0]),
+                       acc_noise_level=str(defaults[1]),
+                       oms_noise_level=str(defaults[2]), tdi='1.5')
+            numpy.testing.assert_array_equal(psd.numpy(), expected.numpy())
+
+    def test_live_psd_variation(self):
+        """Test the Live PSD variation against a direct convolution"""
+        import scipy.signal
+        from pycbc.psd import variation
+        sample_rate, increment, trim = 256, 8, 2.
+        psd = FrequencySeries(numpy.ones(8 * sample_rate // 2 + 1),
+                              delta_f=1. / 8)
+        filt = variation.live_create_filter(psd, 8, sample_rate,
+                                            high_freq=100)
+        strain = TimeSeries(numpy.random.normal(size=40 * sample_rate),
+                            delta_t=1. / sample_rate)
+        psd_var = variation.live_calc_psd_variation(strain, filt, increment)
+        self.assertEqual(len(psd_var), increment + trim)
+
+        astrain = strain.time_slice(strain.end_time - increment - 3 * trim,
+                                    strain.end_time)
+        wstrain = scipy.signal.fftconvolve(astrain, numpy.asarray(filt),
+                                           mode='same')
+        wstrain = wstrain[int(trim * sample_rate):-int(trim * sample_rate)]
+        short_ms = numpy.mean(wstrain.reshape(-1, sample_rate // 4) ** 2,
+                              axis=1)
+        ave = 0.5 * (short_ms[2:] + short_ms[:-2])
+        outliers = short_ms[1:-1] > (2. * ave)
+        short_ms[1:-1][outliers] = ave[outliers]
+        expected = short_ms.reshape(-1, 4).mean(axis=1)
+        numpy.testing.assert_allclose(psd_var.numpy(), expected, rtol=1e-10)
+
+        # Several detectors filtered together give the same result
+        strains = {'H1': strain, 'L1': strain * 2.}
+        filts = {'H1': filt,
+                 'L1': variation.live_create_filter(psd * 3., 8, sample_rate,
+                                                    high_freq=80)}
+        psd_vars = variation.live_calc_psd_variation_batched(strains, filts,
+                                                             increment)
+        for ifo in strains:
+            expected = variation.live_calc_psd_variation(
+                strains[ifo], filts[ifo], increment)
+            self.assertEqual(psd_vars[ifo].start_time, expected.start_time)
+            numpy.testing.assert_allclose(psd_vars[ifo].numpy(),
+                                          expected.numpy(), rtol=1e-10)
+
+    def test_filt_psd_variation(self):
+        """Test the offline PSD variation against a direct convolution"""
+        import scipy.signal
+        from pycbc.psd import variation
+        sample_rate, crop = 256, 8
+        segment, short_segment, psd_long, psd_dur, psd_stride = \
+            8, 0.25, 64, 8, 4
+        low_freq, high_freq = 20., 100.
+        numpy.random.seed(0)
+        # The last two long segments overrun the end of the data
+        noise = numpy.random.normal(size=180 * sample_rate)
+        noise[100 * sample_rate:100 * sample_rate + 20] *= 50
+
+        filt = scipy.signal.firwin(4 * sample_rate, [low_freq, high_freq],
+                                   pass_zero=False, window='hann',
+                                   fs=sample_rate)
+        filt = abs(numpy.fft.rfft(filt, n=psd_dur * sample_rate))
+        end_psd = pycbc.psd.welch(
+            TimeSeries(noise, delta_t=1. / sample_rate, epoch=0).time_slice(
+                180 - psd_long, 180),
+            seg_len=psd_dur * sample_rate,
+            seg_stride=psd_stride * sample_rate, avg_method='median')
+        expected = []
+        for tlong in numpy.arange(0, 180, psd_long - 2 * crop - segment + 1):
+            tlong = int(tlong)
+            astrain = noise[tlong * sample_rate:
+                            min(tlong + psd_long, 180) * sample_rate]
+            if tlong + psd_long <= 180:
+                plong = pycbc.psd.welch(
+                    TimeSeries(astrain, delta_t=1. / sample_rate),
+                    seg_len=psd_dur * sample_rate,
+                    seg_stride=psd_stride * sample_rate,
+                    avg_method='median')
+            else:
+                plong = end_psd
+            freqs = plong.sample_frequencies.numpy()
+            plong = plong.numpy()
+            with numpy.errstate(divide='ignore'):
+                fweight = freqs ** (-7. / 6.) * filt / numpy.sqrt(plong)
+            fweight[0] = 0.
+            fweight *= (sum(fweight ** 2) / (len(fweight) - 1.)) ** -0.5
+            fwhiten = numpy.sqrt(2. / sample_rate) / numpy.sqrt(plong)
+            fwhiten[0] = 0.
+            full_filt = scipy.signal.windows.hann(psd_dur * sample_rate) * \
+                numpy.roll(numpy.fft.irfft(fwhiten * fweight),
+                           psd_dur // 2 * sample_rate)
+            wstrain = scipy.signal.fftconvolve(astrain, full_filt,
+                                               mode='same')
+            wstrain = wstrain[crop * sample_rate:-crop * sample_rate]
+            short_ms = numpy.mean(wstrain.reshape(-1, sample_rate // 4) ** 2,
+                                  axis=1)
+            ave = 0.5 * (short_ms[2:] + short_ms[:-2])
+            outliers = short_ms[1:-1] > (2. * ave)
+            short_ms[1:-1][outliers] = ave[outliers]
+            for index in range(len(wstrain) // sample_rate - segment + 1):
+                expected.append(short_ms[4 * index:4 * (index + segment)]
+                                .mean())
+        expected = numpy.array(expected)
+
+        for dtype, rtol in ((numpy.float64, 1e-10), (numpy.float32, 1e-5)):
+            strain = TimeSeries(noise.astype(dtype), delta_t=1. / sample_rate,
+                                epoch=1000000000)
+            psd_var = variation.calc_filt_psd_variation(
+                strain, segment, short_segment, psd_long, psd_dur,
+                psd_stride, 'median', low_freq, high_freq)
+            self.assertEqual(len(psd_var), len(expected))
+            self.assertEqual(psd_var.dtype, dtype)
+            self.assertEqual(psd_var.delta_t, 1.)
+            self.assertEqual(float(psd_var.start_time),
+                             1000000000 + crop + segment)
+            numpy.testing.assert_allclose(psd_var.numpy(), expected,
+                                          rtol=rtol)
+
     def test_read(self):
         """Test reading PSDs from text files"""
         test_data = numpy.zeros((self.psd_len, 2))
@@ -0,0 +1,140 @@
+"""
+Unit tests for the PyGRB post-processing utilities
+"""
+
+import os
+import tempfile
+import unittest
+import numpy
+import igwn_segments as segments
+from utils import simple_exit
+from pycbc.io.hdf import HFile
+from pycbc.results import pygrb_postprocessing_utils as ppu
+
+
+def random_seglist(rng, num):
+    """A coalesced segment list of up to num segments with integer edges,
+    so that times and trials often land exactly on the boundaries."""
+    edges = numpy.unique(rng.integers(0, 200, size=2 * num))
+    if len(edges) % 2:
+        edges = edges[:-1]
+    seg_list = segments.segmentlist(
+        segments.segment(float(start), float(end))
+        for start, end in edges.reshape(-1, 2))
+    return seg_list.coalesce()
+
+
+class SegmentsTest(unittest.TestCase):
+    def test_in_segments(self):
+        """Segments are half-open, as for `time in seg_list`"""
+        seg_list = segments.segmentlist([segments.segment(10., 20.),
+                                         segments.segment(30., 40.)])
+        times = numpy.array([9.99, 10., 15., 20., 25., 30., 39.99, 40.])
+        expected = [False, True, True, False, False, True, True, False]
+        self.assertEqual(ppu._in_segments(times, seg_list).tolist(),
+                         expected)
+        self.assertFalse(
+            ppu._in_segments(times, segments.segmentlist([])).any())
+
+        rng = numpy.random.default_rng(0)
+        for _ in range(200):
+            seg_list = random_seglist(rng, 5)
+            times = rng.integers(-5, 205, size=50) + \
+                rng.choice([0., 0.5], size=50)
+            expected = [time in seg_list for time in times]
+            self.assertEqual(ppu._in_segments(times, seg_list).tolist(),
+                             expected)
+
+    def test_intersects_segments(self):
+        """Trials touching a segment do not intersect it, as for
+        `seg_list.intersects_segment`"""
+        seg_list = segments.segmentlist([segments.segment(10., 20.)])
+        starts = numpy.array([0., 20., 5., 15., 12., 0.])
+        ends = numpy.array([10., 30., 11., 25., 18., 30.])
+        expected = [False, False, True, True, True, True]
+        self.assertEqual(
+            ppu._intersects_segments(starts, ends, seg_list).tolist(),
+            expected)
+        self.assertFalse(ppu._intersects_segments(
+            starts, ends, segments.segmentlist([])).any())
+
+        rng = numpy.random.default_rng(1)
+        for _ in range(200):
+            seg_list = random_seglist(rng, 5)
+            starts = rng.integers(-5, 205, size=50).astype(float)
+            ends = starts + rng.integers(1, 20, size=50)
+            expected = [seg_list.intersects_segment(segments.segment(s, e))
+                        for s, e in zip(starts, ends)]
+            self.assertEqual(
+                ppu._intersects_segments(starts, ends, seg_list).tolist(),
+                expected)
+
+    def test_sort_trigs(self):
+        """Triggers within 0.01 s of the analysed segments are accepted,
+        and only those in the trials are kept"""
+        seg_dict = {0: segments.segmentlist([segments.segment(100., 200.)]),
+                    1: segments.segmentlist([segments.segment(100., 200.)])}
+        trial_dict = {
+            0: segments.segmentlist([segments.segment(100., 150.)]),
+            1: segments.segmentlist([segments.segment(150., 200.)])}
+        trigs = {'network/slide_id': numpy.array([1, 0, 0, 1, 0, 1]),
+                 'network/event_id': numpy.array([0, 1, 2, 3, 4, 5]),
+                 'network/end_time_gc': numpy.array([200.005, 99.995, 149.9,
+                                                     150., 150., 199.])}
+        sorted_trigs = ppu.sort_trigs(trial_dict, trigs, seg_dict, seg_dict)
+        self.assertEqual(sorted_trigs[0].tolist(), [2])
+        self.assertEqual(sorted_trigs[1].tolist(), [3, 5])
+
+        trigs['network/end_time_gc'][0] = 200.02
+        with self.assertRaises(RuntimeError):
+            ppu.sort_trigs(trial_dict, trigs, seg_dict, seg_dict)
+
+
+class FirstLocationsTest(unittest.TestCase):
+    def test_first_locations(self):
+        """Values are located at their first occurrence, and a missing
+        value raises an error"""
+        array = numpy.array([5, 3, 8, 3, 1])
+        self.assertEqual(
+            ppu.first_locations(array, numpy.array([3, 1, 5, 8, 3])).tolist(),
+            [1, 4, 0, 2, 1])
+        for values in ([3, 4], [9], [0]):
+            with self.assertRaises(RuntimeError):
+                ppu.first_locations(array, numpy.array(values))
+
+
+class TemplateHashTest(unittest.TestCase):
+    def test_template_hash_to_id(self):
+        """Repeated bank hashes map to their last index and hashes missing
+        from the bank to 0, as with a loop over the bank"""
+        bank_hashes = numpy.array([7, 3, 9, 3, 5, 7, 1])
+        trig_hashes = numpy.array([3, 9, 2, 7, 1, 10, 5, 0, 3])
+        expected = numpy.zeros(len(trig_hashes), dtype=int)
+        for idx, t_hash in enumerate(bank_hashes):
+            expected[trig_hashes == t_hash] = idx
+        self.assertEqual(expected.tolist(), [3, 2, 0, 5, 6, 0, 4, 0, 3])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bank_path = os.path.join(tmpdir, 'bank.hdf')
+            with HFile(bank_path, 'w') as bank:
+                bank['template_hash'] = bank_hashes
+            trig_path = os.path.join(tmpdir, 'trigs.hdf')
+            with HFile(trig_path, 'w') as trigs:
+                trigs['network/event_id'] = numpy.arange(len(trig_hashes))
+                trigs['H1/template_hash'] = trig_hashes
+                trigs['L1/template_hash'] = trig_hashes
+            with HFile(trig_path, 'r') as trigs:
+                trig_ids = ppu.template_hash_to_id(trigs, bank_path)
+        self.assertEqual(trig_ids.tolist(), expected.tolist())
+
+
+# create and populate unittest's test suite
+suite = unittest.TestSuite()
+test_loader = unittest.TestLoader()
+suite.addTest(test_loader.loadTestsFromTestCase(SegmentsTest))
+suite.addTest(test_loader.loadTestsFromTestCase(FirstLocationsTest))
+suite.addTest(test_loader.loadTestsFromTestCase(TemplateHashTest))
+
+if __name__ == '__main__':
+    results = unittest.TextTestRunner(verbosity=2).run(suite)
+    simple_exit(results)